@@ -13,8 +13,70 @@
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from pcm import PairwiseComparisonMatrix
-from scales import calculate_informativeness
-import warnings
+import math
+
+# Опціональне JIT-прискорення ядра агрегації (numba)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _weighted_log_mean_kernel(values, weights):
+        """
+        Зважене геометричне середнє по осі експертів для масивів (E, m).
+        Поєднує log, множення, накопичення та ділення в один прохід.
+        """
+        n_experts, n_cells = values.shape
+        out = np.empty(n_cells)
+        for k in prange(n_cells):
+            log_sum = 0.0
+            weight_sum = 0.0
+            for e in range(n_experts):
+                w = weights[e, k]
+                if w > 0:
+                    log_sum += w * math.log(values[e, k])
+                    weight_sum += w
+            out[k] = math.exp(log_sum / weight_sum) if weight_sum > 0 else 1.0
+        return out
+
+
+def _weighted_log_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Зважене геометричне середнє exp(Σ w_e * log(v_e) / Σ w_e) по осі експертів.
+    Елементи без жодної ваги дорівнюють 1.
+
+    Args:
+        values: Масив значень (E, m)
+        weights: Масив ваг (E, m)
+
+    Returns:
+        Вектор (m,) агрегованих значень
+    """
+    if NUMBA_AVAILABLE:
+        return _weighted_log_mean_kernel(values, weights)
+
+    # Логарифмуємо лише елементи з ненульовою вагою, решта дає 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_values = np.log(values, out=np.zeros_like(values), where=weights > 0)
+
+    # Σ_e w_e·log(v_e) без проміжного тензора добутків
+    weighted_log_sum = np.einsum('em,em->m', weights, log_values)
+    weights_sum = weights.sum(axis=0)
+    has_judgments = weights_sum > 0
+
+    # Якщо немає оцінок від жодного експерта, залишаємо 1 (exp(0))
+    mean_log = np.divide(weighted_log_sum, weights_sum,
+                         out=np.zeros_like(weighted_log_sum), where=has_judgments)
+    return np.exp(mean_log)
+
+
+# Максимальна кількість оцінок, для якої aggregate_judgments_geometric
+# використовує скалярний цикл замість NumPy
+_SCALAR_AGGREGATION_MAX = 8
 
 
 def calculate_judgment_weight(scale_informativeness: float,
@@ -60,6 +122,23 @@ def aggregate_judgments_geometric(judgments: List[Tuple[float, float]]) -> float
     if not judgments:
         return 1.0
 
+    # Для кількох оцінок (типово 2-5 експертів) скалярний цикл швидший за
+    # накладні витрати виклику NumPy; log/множення/exp виконуються в одному проході
+    if len(judgments) <= _SCALAR_AGGREGATION_MAX and all(v > 0 for v, _ in judgments):
+        log_sum = 0.0
+        weighted_log_sum = 0.0
+        weight_sum = 0.0
+        for value, weight in judgments:
+            log_value = math.log(value)
+            log_sum += log_value
+            weighted_log_sum += weight * log_value
+            weight_sum += weight
+
+        if weight_sum > 0:
+            return math.exp(weighted_log_sum / weight_sum)
+        # Нульові ваги — звичайне геометричне середнє
+        return math.exp(log_sum / len(judgments))
+
     # Зважене геометричне середнє: (∏ v_i^w_i)^(1/∑w_i)
     values = np.array([j[0] for j in judgments])
     weights = np.array([j[1] for j in judgments])
@@ -72,8 +151,7 @@ def aggregate_judgments_geometric(judgments: List[Tuple[float, float]]) -> float
 
     # Обчислюємо зважене геометричне середнє
     # log(GM) = Σ w_i * log(v_i)
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
+    with np.errstate(divide='ignore', invalid='ignore'):
         log_values = np.log(values)
 
     weighted_log_sum = np.sum(weights * log_values)
@@ -117,58 +195,58 @@ def group_aggregate(pcm_list: List[PairwiseComparisonMatrix],
         if pcm.n_alternatives != n or pcm.alternatives != alternatives:
             raise ValueError("Усі МПП повинні мати однакові альтернативи")
 
-    # Ініціалізуємо агреговану матрицю
-    aggregated_matrix = np.ones((n, n))
-
     # Якщо коефіцієнти компетентності не задані, всі експерти рівнокомпетентні
     if competence_coefficients is None:
         competence_coefficients = {pcm.expert_id: 1.0 for pcm in pcm_list}
 
-    # Агрегуємо кожний елемент матриці
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                aggregated_matrix[i, j] = 1.0
-                continue
-
-            # Збираємо оцінки від усіх експертів для цієї пари
-            judgments_with_weights = []
-
-            for pcm in pcm_list:
-                if pcm.filled_mask[i, j]:
-                    # Отримуємо уніфіковане значення
-                    value = pcm.unified_matrix[i, j]
-
-                    # Отримуємо інформацію про вихідну шкалу
-                    if (i, j) in pcm.original_judgments:
-                        scale_type, n_gradations, _ = pcm.original_judgments[(i, j)]
-                        informativeness = calculate_informativeness(n_gradations)
-                    else:
-                        # Якщо інформація про шкалу відсутня (транзитивне заповнення),
-                        # використовуємо мінімальну інформативність
-                        informativeness = 1.0
-
-                    # Коефіцієнт компетентності
-                    competence = competence_coefficients.get(pcm.expert_id, 1.0)
-
-                    # Обчислюємо вагу оцінки
-                    weight = calculate_judgment_weight(informativeness, competence)
-
-                    judgments_with_weights.append((value, weight))
-
-            # Агрегуємо за допомогою зваженого геометричного середнього
-            if judgments_with_weights:
-                aggregated_value = aggregate_judgments_geometric(judgments_with_weights)
-                aggregated_matrix[i, j] = aggregated_value
-            else:
-                # Якщо немає оцінок від жодного експерта, залишаємо 1
-                aggregated_matrix[i, j] = 1.0
-
-    # Забезпечуємо зворотну симетрію
-    for i in range(n):
-        for j in range(i + 1, n):
-            if aggregated_matrix[i, j] != 0:
-                aggregated_matrix[j, i] = 1.0 / aggregated_matrix[i, j]
+    # Агрегуємо лише верхню трикутну частину (i < j), нижню отримуємо
+    # через зворотну симетрію
+    upper_i, upper_j = np.triu_indices(n, k=1)
+
+    # Масиви (E, m): уніфіковані значення, маски заповнення та інформативність
+    n_experts = len(pcm_list)
+    n_cells = len(upper_i)
+    values = np.ones((n_experts, n_cells))
+    filled = np.zeros((n_experts, n_cells), dtype=bool)
+    # Якщо інформація про шкалу відсутня (транзитивне заповнення),
+    # використовуємо мінімальну інформативність
+    informativeness = np.ones((n_experts, n_cells))
+
+    for e, pcm in enumerate(pcm_list):
+        mask = pcm.filled_mask[upper_i, upper_j]
+        filled[e] = mask
+        # Незаповнені елементи замінюємо на 1, щоб log(1) = 0 не впливав на суму
+        values[e] = np.where(mask, pcm.unified_matrix[upper_i, upper_j], 1.0)
+
+        # Інформативність вихідної шкали (I = log₂ N) оцінок верхнього трикутника;
+        # номер комірки (i, j) у порядку triu_indices: i·n - i(i+1)/2 + (j - i - 1)
+        judgment_ij = pcm.judgment_ij
+        is_upper = judgment_ij[:, 0] < judgment_ij[:, 1]
+        i, j = judgment_ij[is_upper, 0], judgment_ij[is_upper, 1]
+        cells = i * n - i * (i + 1) // 2 + (j - i - 1)
+        informativeness[e, cells] = np.log2(pcm.judgment_gradations[is_upper])
+
+    # Коефіцієнти компетентності експертів
+    competence = np.array([
+        competence_coefficients.get(pcm.expert_id, 1.0) for pcm in pcm_list
+    ])
+
+    # Вага оцінки = інформативність × компетентність (РЗОД-2011-4.pdf)
+    weights = informativeness * competence[:, np.newaxis] * filled
+
+    # Якщо сумарна вага елемента нульова, всі надані оцінки рівноважні
+    weights_sum = weights.sum(axis=0)
+    weights = np.where(weights_sum > 0, weights, filled).astype(float)
+
+    # Зважене геометричне середнє: exp(Σ w_e * log(v_e) / Σ w_e)
+    upper = _weighted_log_mean(values, weights)
+
+    # Збираємо матрицю та забезпечуємо зворотну симетрію
+    aggregated_matrix = np.ones((n, n))
+    aggregated_matrix[upper_i, upper_j] = upper
+    # a_ji = 1 / a_ij без розгалужень; нульові елементи дають 1
+    aggregated_matrix[upper_j, upper_i] = np.divide(1.0, upper, out=np.ones_like(upper),
+                                                    where=upper != 0)
 
     return aggregated_matrix
 
@@ -206,18 +284,15 @@ def calculate_expert_weights(pcm_list: List[PairwiseComparisonMatrix],
     expert_total_weights = {}
 
     for pcm in pcm_list:
-        total_informativeness = 0.0
-        n_judgments = 0
-
-        # Рахуємо загальну інформативність оцінок експерта
-        for (i, j), (scale_type, n_gradations, _) in pcm.original_judgments.items():
-            if i < j:  # Рахуємо тільки верхню трикутну частину
-                informativeness = calculate_informativeness(n_gradations)
-                total_informativeness += informativeness
-                n_judgments += 1
+        # Рахуємо тільки верхню трикутну частину
+        judgment_ij = pcm.judgment_ij
+        upper = judgment_ij[:, 0] < judgment_ij[:, 1]
 
-        # Середня інформативність оцінок експерта
-        avg_informativeness = total_informativeness / n_judgments if n_judgments > 0 else 1.0
+        # Середня інформативність оцінок експерта (I = log₂ N)
+        if upper.any():
+            avg_informativeness = float(np.log2(pcm.judgment_gradations[upper]).mean())
+        else:
+            avg_informativeness = 1.0
 
         # Коефіцієнт компетентності
         competence = competence_coefficients.get(pcm.expert_id, 1.0)
@@ -275,9 +350,8 @@ def aggregate_with_statistics(pcm_list: List[PairwiseComparisonMatrix],
     # Статистика по експертах
     expert_stats = []
     for pcm in pcm_list:
-        n_original_judgments = len([
-            (i, j) for (i, j) in pcm.original_judgments.keys() if i < j
-        ])
+        judgment_ij = pcm.judgment_ij
+        n_original_judgments = int(np.count_nonzero(judgment_ij[:, 0] < judgment_ij[:, 1]))
 
         stats = {
             'expert_id': pcm.expert_id,
@@ -10,9 +10,8 @@
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-from scipy.linalg import eig
-import warnings
 
 # Випадковий індекс (Random Index) для різних розмірів матриць
 # Базується на стандартних значеннях Сааті (РЗОД-2011-4.pdf)
@@ -35,6 +34,171 @@ RANDOM_INDEX = {
 }
 
 
+def _principal_eig_full(matrix: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Повне розвинення за власними значеннями (резервний шлях для довільних матриць).
+
+    Returns:
+        (λ_max, відповідний власний вектор) — дійсні частини
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        eigenvalues, eigenvectors = np.linalg.eig(matrix)
+
+    max_idx = np.argmax(np.real(eigenvalues))
+    return float(np.real(eigenvalues[max_idx])), np.real(eigenvectors[:, max_idx])
+
+
+def _perron_small(matrix: np.ndarray) -> Optional[Tuple[float, np.ndarray]]:
+    """
+    Аналітичні λ_max та головний власний вектор для додатних матриць n ≤ 3.
+
+    n = 2: λ = (a + d)/2 + √(((a - d)/2)² + bc);
+    n = 3: найбільший дійсний корінь характеристичного многочлена
+    λ³ - tr(A)·λ² + M₂·λ - det(A) (формула Кардано / тригонометрична),
+    власний вектор — векторний добуток рядків A - λI.
+
+    Returns:
+        (λ_max, власний вектор з сумою 1) або None, якщо аналітичний шлях
+        не дав надійного результату
+    """
+    n = matrix.shape[0]
+
+    if n == 1:
+        return float(matrix[0, 0]), np.ones(1)
+
+    if n == 2:
+        a, b = matrix[0]
+        c, d = matrix[1]
+        lambda_max = (a + d) / 2 + np.sqrt(((a - d) / 2) ** 2 + b * c)
+        vector = np.array([b, lambda_max - a])
+        return float(lambda_max), vector / vector.sum()
+
+    # n == 3: λ³ + p2·λ² + p1·λ + p0
+    trace = np.trace(matrix)
+    minors = (matrix[0, 0] * matrix[1, 1] - matrix[0, 1] * matrix[1, 0]
+              + matrix[0, 0] * matrix[2, 2] - matrix[0, 2] * matrix[2, 0]
+              + matrix[1, 1] * matrix[2, 2] - matrix[1, 2] * matrix[2, 1])
+    det = np.linalg.det(matrix)
+    p2, p1, p0 = -trace, minors, -det
+
+    # Зведений многочлен x³ + p·x + q, λ = x - p2/3
+    p = p1 - p2 ** 2 / 3
+    q = 2 * p2 ** 3 / 27 - p2 * p1 / 3 + p0
+    discriminant = (q / 2) ** 2 + (p / 3) ** 3
+
+    if discriminant > 0:
+        # Один дійсний корінь
+        sqrt_disc = np.sqrt(discriminant)
+        x = np.cbrt(-q / 2 + sqrt_disc) + np.cbrt(-q / 2 - sqrt_disc)
+    elif p < 0:
+        # Три дійсні корені — беремо найбільший
+        cos_arg = np.clip(3 * q / (2 * p) * np.sqrt(-3 / p), -1.0, 1.0)
+        x = 2 * np.sqrt(-p / 3) * np.cos(np.arccos(cos_arg) / 3)
+    else:
+        x = 0.0
+
+    lambda_max = x - p2 / 3
+
+    # Уточнення кореня одним кроком Ньютона
+    derivative = 3 * lambda_max ** 2 + 2 * p2 * lambda_max + p1
+    if derivative != 0:
+        lambda_max -= (((lambda_max + p2) * lambda_max + p1) * lambda_max + p0) / derivative
+
+    # Власний вектор: ядро A - λI як найбільший векторний добуток пар рядків
+    shifted = matrix - lambda_max * np.eye(3)
+    candidates = [np.cross(shifted[0], shifted[1]),
+                  np.cross(shifted[0], shifted[2]),
+                  np.cross(shifted[1], shifted[2])]
+    vector = max(candidates, key=lambda v: np.abs(v).sum())
+    vector = vector / vector.sum()
+
+    if not np.all(vector > 0):
+        return None
+
+    return float(lambda_max), vector
+
+
+def _perron(matrix: np.ndarray, tol: float = 1e-12,
+            max_iter: int = 1000) -> Tuple[float, np.ndarray]:
+    """
+    Власне значення та вектор Перрона з кешуванням за вмістом матриці:
+    повторний розрахунок для незміненої матриці (напр. узгодженість і ваги
+    однієї агрегованої МПП) зводиться до пошуку в кеші.
+
+    Args:
+        matrix: Матриця попарних порівнянь (n x n)
+        tol: Точність збіжності за максимумом модуля різниці векторів
+        max_iter: Максимальна кількість ітерацій
+
+    Returns:
+        (λ_max, головний власний вектор з сумою 1)
+
+    Examples:
+        >>> lambda_max, vector = _perron(np.array([[1, 3], [1/3, 1]]))
+        >>> abs(lambda_max - 2.0) < 1e-9
+        True
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=float)
+    if matrix.ndim != 2:
+        return _perron_power(matrix, tol, max_iter)
+
+    lambda_max, vector = _perron_cached(matrix.tobytes(), matrix.shape, tol, max_iter)
+    # Кешований вектор спільний для всіх викликів - повертаємо копію
+    return lambda_max, vector.copy()
+
+
+@lru_cache(maxsize=256)
+def _perron_cached(data: bytes, shape: Tuple[int, ...], tol: float,
+                   max_iter: int) -> Tuple[float, np.ndarray]:
+    """_perron_power для матриці, відновленої з байтів (ключ кешу)"""
+    matrix = np.frombuffer(data).reshape(shape)
+    lambda_max, vector = _perron_power(matrix, tol, max_iter)
+    vector = np.asarray(vector)
+    vector.setflags(write=False)
+    return lambda_max, vector
+
+
+def _perron_power(matrix: np.ndarray, tol: float = 1e-12,
+                  max_iter: int = 1000) -> Tuple[float, np.ndarray]:
+    """
+    Степеневий метод для власного значення та вектора Перрона.
+    Для додатної МПП λ_max та головний власний вектор є дійсними і додатними,
+    тому достатньо ітерацій v ← A·v / Σ(A·v).
+
+    Args:
+        matrix: Матриця попарних порівнянь (n x n)
+        tol: Точність збіжності за максимумом модуля різниці векторів
+        max_iter: Максимальна кількість ітерацій
+
+    Returns:
+        (λ_max, головний власний вектор з сумою 1)
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    n = matrix.shape[0]
+
+    # Степеневий метод гарантовано збігається лише для додатних матриць
+    if n == 0 or not np.all(matrix > 0):
+        return _principal_eig_full(matrix)
+
+    # Для малих матриць — аналітичний розв'язок без ітерацій
+    if n <= 3:
+        result = _perron_small(matrix)
+        if result is not None:
+            return result
+
+    vector = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        product = matrix @ vector
+        lambda_max = product.sum()
+        new_vector = product / lambda_max
+        if np.max(np.abs(new_vector - vector)) < tol:
+            return float(lambda_max), new_vector
+        vector = new_vector
+
+    # Не зійшлося — використовуємо повне розвинення
+    return _principal_eig_full(matrix)
+
+
 def calculate_lambda_max(matrix: np.ndarray) -> float:
     """
     Розраховує максимальне власне значення λ_max матриці.
@@ -52,17 +216,30 @@ def calculate_lambda_max(matrix: np.ndarray) -> float:
         >>> 3.0 <= lambda_max <= 3.1
         True
     """
-    n = matrix.shape[0]
+    lambda_max, _ = _perron(matrix)
 
-    # Обчислюємо власні значення
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        eigenvalues, _ = eig(matrix)
+    return float(lambda_max)
 
-    # Беремо дійсну частину максимального власного значення
-    lambda_max = np.max(np.real(eigenvalues))
 
-    return float(lambda_max)
+def _ci_from_lambda(lambda_max: float, n: int) -> float:
+    """CI = (λ_max - n) / (n - 1) для вже обчисленого λ_max"""
+    if n <= 1:
+        return 0.0
+
+    return float((lambda_max - n) / (n - 1))
+
+
+def _cr_from_ci(ci: float, n: int) -> float:
+    """CR = CI / RI для вже обчисленого CI"""
+    if n <= 2:
+        return 0.0
+
+    ri = RANDOM_INDEX.get(n, 1.49)  # За замовчуванням RI для n=15
+
+    if ri == 0:
+        return 0.0
+
+    return float(ci / ri)
 
 
 def calculate_consistency_index(matrix: np.ndarray) -> float:
@@ -88,10 +265,7 @@ def calculate_consistency_index(matrix: np.ndarray) -> float:
     if n <= 1:
         return 0.0
 
-    lambda_max = calculate_lambda_max(matrix)
-    ci = (lambda_max - n) / (n - 1)
-
-    return float(ci)
+    return _ci_from_lambda(calculate_lambda_max(matrix), n)
 
 
 def calculate_consistency_ratio(matrix: np.ndarray) -> float:
@@ -117,15 +291,7 @@ def calculate_consistency_ratio(matrix: np.ndarray) -> float:
     if n <= 2:
         return 0.0
 
-    ci = calculate_consistency_index(matrix)
-    ri = RANDOM_INDEX.get(n, 1.49)  # За замовчуванням RI для n=15
-
-    if ri == 0:
-        return 0.0
-
-    cr = ci / ri
-
-    return float(cr)
+    return _cr_from_ci(calculate_consistency_index(matrix), n)
 
 
 def consistency_spectral(matrix: np.ndarray) -> Dict[str, float]:
@@ -146,9 +312,15 @@ def consistency_spectral(matrix: np.ndarray) -> Dict[str, float]:
         True
     """
     n = matrix.shape[0]
-    lambda_max = calculate_lambda_max(matrix)
-    ci = calculate_consistency_index(matrix)
-    cr = calculate_consistency_ratio(matrix)
+
+    # λ_max обчислюємо один раз, CI та CR виводимо з нього
+    return _consistency_report(calculate_lambda_max(matrix), n)
+
+
+def _consistency_report(lambda_max: float, n: int) -> Dict[str, float]:
+    """Показники узгодженості для вже обчисленого λ_max матриці n x n"""
+    ci = _ci_from_lambda(lambda_max, n)
+    cr = _cr_from_ci(ci, n)
 
     # Критерій узгодженості: CR < 0.10 (РЗОД-2011-4.pdf)
     is_consistent = cr < 0.10
@@ -181,19 +353,14 @@ def calculate_weights_eigenvector(matrix: np.ndarray) -> np.ndarray:
         >>> abs(weights.sum() - 1.0) < 0.01
         True
     """
-    n = matrix.shape[0]
-
-    # Обчислюємо власні вектори
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        eigenvalues, eigenvectors = eig(matrix)
+    # Головний власний вектор (степеневий метод)
+    _, principal_eigenvector = _perron(matrix)
 
-    # Знаходимо індекс максимального власного значення
-    max_idx = np.argmax(np.real(eigenvalues))
+    return _weights_from_eigenvector(principal_eigenvector)
 
-    # Беремо відповідний власний вектор
-    principal_eigenvector = np.real(eigenvectors[:, max_idx])
 
+def _weights_from_eigenvector(principal_eigenvector: np.ndarray) -> np.ndarray:
+    """Нормалізовані додатні ваги з головного власного вектора"""
     # Нормалізуємо (робимо суму = 1)
     weights = principal_eigenvector / np.sum(principal_eigenvector)
 
@@ -204,6 +371,31 @@ def calculate_weights_eigenvector(matrix: np.ndarray) -> np.ndarray:
     return weights
 
 
+def consistency_and_weights(matrix: np.ndarray) -> Dict:
+    """
+    Показники узгодженості та ваги методом власного вектора з одного
+    розрахунку пари Перрона (λ_max, головний власний вектор).
+    Базується на РЗОД-2011-4.pdf, РЗОД-2012-1.pdf
+
+    Args:
+        matrix: Матриця попарних порівнянь (n x n)
+
+    Returns:
+        Словник показників як у consistency_spectral та вектор ваг у 'weights'
+
+    Examples:
+        >>> matrix = np.array([[1, 3], [1/3, 1]])
+        >>> result = consistency_and_weights(matrix)
+        >>> result['is_consistent'], round(float(result['weights'][0]), 2)
+        (True, 0.75)
+    """
+    lambda_max, principal_eigenvector = _perron(matrix)
+
+    result = _consistency_report(float(lambda_max), matrix.shape[0])
+    result['weights'] = _weights_from_eigenvector(principal_eigenvector)
+    return result
+
+
 def calculate_weights_geometric_mean(matrix: np.ndarray) -> np.ndarray:
     """
     Розраховує вагові коефіцієнти методом середнього геометричного рядків.
@@ -221,15 +413,34 @@ def calculate_weights_geometric_mean(matrix: np.ndarray) -> np.ndarray:
         >>> abs(weights.sum() - 1.0) < 0.01
         True
     """
-    n = matrix.shape[0]
+    return calculate_weights_geometric_mean_batch(np.asarray(matrix)[np.newaxis])[0]
+
+
+def calculate_weights_geometric_mean_batch(matrices: np.ndarray) -> np.ndarray:
+    """
+    Розраховує вагові коефіцієнти методом середнього геометричного рядків
+    для стеку матриць за один векторизований прохід (напр., для ієрархії критеріїв).
+
+    Args:
+        matrices: Стек матриць попарних порівнянь (K x n x n)
 
+    Returns:
+        Матриця вагових коефіцієнтів (K x n), кожен рядок нормалізований
+
+    Examples:
+        >>> matrices = np.array([[[1, 3], [1/3, 1]], [[1, 1/5], [5, 1]]])
+        >>> weights = calculate_weights_geometric_mean_batch(matrices)
+        >>> weights.shape
+        (2, 2)
+        >>> bool(np.allclose(weights.sum(axis=1), 1.0))
+        True
+    """
     # Обчислюємо середнє геометричне для кожного рядка
-    # Формула: w_i = (∏_j a_ij)^(1/n)
-    row_products = np.prod(matrix, axis=1)
-    geometric_means = np.power(row_products, 1.0 / n)
+    # Формула: w_i = (∏_j a_ij)^(1/n) = exp(mean_j log a_ij) — без переповнення добутку
+    geometric_means = np.exp(np.log(matrices).mean(axis=-1))
 
-    # Нормалізуємо
-    weights = geometric_means / np.sum(geometric_means)
+    # Нормалізуємо кожну матрицю окремо
+    weights = geometric_means / geometric_means.sum(axis=-1, keepdims=True)
 
     return weights
 
@@ -254,15 +465,12 @@ def ideal_pcm(weights: np.ndarray) -> np.ndarray:
         >>> abs(ideal[0, 1] - 2.0) < 0.01
         True
     """
-    n = len(weights)
-    ideal_matrix = np.zeros((n, n))
+    weights = np.asarray(weights, dtype=float)
 
-    for i in range(n):
-        for j in range(n):
-            if weights[j] != 0:
-                ideal_matrix[i, j] = weights[i] / weights[j]
-            else:
-                ideal_matrix[i, j] = 1.0
+    # Зовнішнє ділення w_i / w_j; для w_j = 0 елемент дорівнює 1
+    nonzero = weights != 0
+    safe_weights = np.where(nonzero, weights, 1.0)
+    ideal_matrix = np.where(nonzero[None, :], weights[:, None] / safe_weights[None, :], 1.0)
 
     return ideal_matrix
 
@@ -297,48 +505,45 @@ def generate_revision_suggestions(matrix: np.ndarray,
     # Генеруємо ідеальну МПП
     ideal_matrix = ideal_pcm(weights)
 
-    # Обчислюємо відхилення від ідеальної МПП
-    deviations = []
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            current_value = matrix[i, j]
-            ideal_value = ideal_matrix[i, j]
-
-            # Обчислюємо відносне відхилення
-            if ideal_value != 0:
-                deviation = abs(current_value - ideal_value) / ideal_value
-            else:
-                deviation = abs(current_value - ideal_value)
-
-            deviations.append({
-                'alt_i': alternatives[i],
-                'alt_j': alternatives[j],
-                'current_value': float(current_value),
-                'ideal_value': float(ideal_value),
-                'deviation': float(deviation),
-                'i': i,
-                'j': j,
-            })
-
-    # Сортуємо за відхиленням (найбільші спочатку)
-    deviations.sort(key=lambda x: x['deviation'], reverse=True)
+    # Паралельні масиви для верхньої трикутної частини (i < j):
+    # індекси, поточні та ідеальні значення, відносні відхилення
+    upper_i, upper_j = np.triu_indices(n, k=1)
+    current_values = np.asarray(matrix, dtype=float)[upper_i, upper_j]
+    ideal_values = ideal_matrix[upper_i, upper_j]
+    deviations = np.abs(current_values - ideal_values) / np.where(ideal_values != 0, ideal_values, 1.0)
+
+    # Відбираємо top_k найбільших відхилень без повного сортування
+    k = max(0, min(top_k, len(deviations)))
+    if k == 0:
+        return []
+    if k < len(deviations):
+        top = np.argpartition(-deviations, k - 1)[:k]
+    else:
+        top = np.arange(len(deviations))
+    # Найбільші спочатку; при рівних відхиленнях зберігаємо порядок пар
+    top = top[np.lexsort((top, -deviations[top]))]
 
     # Формуємо рекомендації
     suggestions = []
-    for dev in deviations[:top_k]:
+    for idx in top:
+        i, j = int(upper_i[idx]), int(upper_j[idx])
+        alt_i, alt_j = alternatives[i], alternatives[j]
+        current_value = float(current_values[idx])
+        ideal_value = float(ideal_values[idx])
+        deviation = float(deviations[idx])
+
         suggestion = {
-            'comparison': f"{dev['alt_i']} vs {dev['alt_j']}",
-            'alt_i': dev['alt_i'],
-            'alt_j': dev['alt_j'],
-            'current_value': dev['current_value'],
-            'suggested_value': dev['ideal_value'],
-            'deviation_percent': dev['deviation'] * 100,
+            'comparison': f"{alt_i} vs {alt_j}",
+            'alt_i': alt_i,
+            'alt_j': alt_j,
+            'current_value': current_value,
+            'suggested_value': ideal_value,
+            'deviation_percent': deviation * 100,
             'message': (
-                f"Рекомендується переглянути порівняння '{dev['alt_i']}' vs '{dev['alt_j']}'. "
-                f"Поточне значення: {dev['current_value']:.2f}, "
-                f"ідеальне значення: {dev['ideal_value']:.2f} "
-                f"(відхилення {dev['deviation'] * 100:.1f}%)"
+                f"Рекомендується переглянути порівняння '{alt_i}' vs '{alt_j}'. "
+                f"Поточне значення: {current_value:.2f}, "
+                f"ідеальне значення: {ideal_value:.2f} "
+                f"(відхилення {deviation * 100:.1f}%)"
             ),
         }
         suggestions.append(suggestion)
@@ -2,18 +2,37 @@
 GUI пакет для методу експертних попарних порівнянь з уточненням переваг
 """
 
+import importlib
+import importlib.util
+
 __version__ = "1.0.0"
 __author__ = "Курсова робота"
 
 # Імпортуємо тільки моделі (без залежності від tkinter)
 from .models import SessionModel, ScaleManager
 
-# Опціонально імпортуємо UI компоненти (потребують tkinter)
-try:
-    from .app import main
-    from .controllers import MainController
-    from .views import StartWindow, ProjectSetupWindow, ComparisonWindow, ResultsWindow
+# UI компоненти (потребують tkinter) імпортуються ліниво при першому зверненні
+# (PEP 562), щоб `import gui` у CLI та тестах не ініціалізував tkinter
+_UI_EXPORTS = {
+    'main': 'app',
+    'MainController': 'controllers',
+    'StartWindow': 'views',
+    'ProjectSetupWindow': 'views',
+    'ComparisonWindow': 'views',
+    'ResultsWindow': 'views',
+}
+
+
+def __getattr__(name):
+    if name in _UI_EXPORTS:
+        module = importlib.import_module(f".{_UI_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+if importlib.util.find_spec('tkinter') is not None:
     __all__ = [
         'main',
         'MainController',
@@ -24,8 +43,8 @@ try:
         'ComparisonWindow',
         'ResultsWindow'
     ]
-except ImportError:
-    # tkinter недоступний, імпортуємо тільки моделі
+else:
+    # tkinter недоступний, експортуємо тільки моделі
     __all__ = [
         'SessionModel',
         'ScaleManager'
@@ -14,8 +14,10 @@ from tkinter import ttk
 import sys
 import os
 
-# Додаємо батьківську директорію до шляху пошуку модулів
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Додаємо батьківську директорію до шляху пошуку модулів (якщо її там ще немає)
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
 
 from gui.controllers import MainController
 
@@ -6,12 +6,16 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from typing import Optional, Dict, List, Tuple
-import json
 import os
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
-from models import SessionModel, Judgment, ScaleType, ScaleManager
-from views import StartWindow, ProjectSetupWindow, ComparisonWindow, ResultsWindow
+from .models import (
+    SessionModel, Judgment, ScaleType, ScaleManager, dump_json,
+    dump_json_array
+)
+from scales import calculate_informativeness
+from .views import StartWindow, ProjectSetupWindow, ComparisonWindow, ResultsWindow
 
 
 class MainController:
@@ -24,6 +28,8 @@ class MainController:
         self.root = root
         self.session: Optional[SessionModel] = None
         self.current_frame: Optional[tk.Frame] = None
+        # Чи заплановано оновлення вікна порівняння (after_idle)
+        self._pending_update = False
 
         # Налаштування вікна
         self.root.title("Метод попарних порівнянь з уточненням переваг")
@@ -105,7 +111,17 @@ class MainController:
             self.current_frame = None
 
     def _update_comparison_display(self):
+        """
+        Запланувати оновлення відображення поточного порівняння.
+        Кілька викликів до наступного idle-циклу Tk об'єднуються в одне оновлення
+        """
+        if not self._pending_update:
+            self._pending_update = True
+            self.root.after_idle(self._flush_comparison_update)
+
+    def _flush_comparison_update(self):
         """Оновити відображення поточного порівняння"""
+        self._pending_update = False
         if not isinstance(self.current_frame, ComparisonWindow) or not self.session:
             return
 
@@ -215,10 +231,11 @@ class MainController:
         can_go_back = self.session.prev_pair()
 
         if can_go_back:
-            # Видаляємо останню оцінку якщо вона є
+            # Видаляємо оцінку пари, до якої повернулися (якщо її не пропустили)
             expert = self.session.get_current_expert()
-            if expert and expert.judgments:
-                expert.judgments.pop()
+            pair = self.session.get_current_pair()
+            if expert and pair:
+                expert.remove_judgment(*pair)
 
             self._update_comparison_display()
         else:
@@ -250,58 +267,18 @@ class MainController:
             return
 
         try:
-            # 1. Експорт ваг у CSV
-            weights_file = os.path.join(directory, "weights.csv")
-            with open(weights_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['rank', 'alternative', 'weight'])
-                writer.writeheader()
-                for item in results['ranking']:
-                    writer.writerow({
-                        'rank': item['rank'],
-                        'alternative': item['alternative'],
-                        'weight': f"{item['weight']:.6f}"
-                    })
-
-            # 2. Експорт узгодженості у JSON
-            consistency_file = os.path.join(directory, "consistency.json")
-            consistency_data = {
-                'consistency_analysis': results['consistency'],
-                'matrix_size': len(self.session.alternatives),
-                'alternatives': self.session.alternatives,
-                'aggregated_matrix': results['aggregated_matrix'].tolist()
-            }
-            with open(consistency_file, 'w', encoding='utf-8') as f:
-                json.dump(consistency_data, f, ensure_ascii=False, indent=2)
-
-            # 3. Експорт рекомендацій у JSON
-            suggestions_file = os.path.join(directory, "suggestions.json")
-            with open(suggestions_file, 'w', encoding='utf-8') as f:
-                json.dump(results['suggestions'], f, ensure_ascii=False, indent=2)
-
-            # 4. Експорт трансформацій шкал
-            scale_transformations = []
-            for expert in self.session.experts:
-                for judgment in expert.judgments:
-                    from scales import calculate_informativeness
-                    entry = {
-                        'expert_id': expert.expert_id,
-                        'comparison': f"{judgment.alt_i} vs {judgment.alt_j}",
-                        'alt_i': judgment.alt_i,
-                        'alt_j': judgment.alt_j,
-                        'scale_type': judgment.scale_type.value,
-                        'n_gradations': judgment.n_gradations,
-                        'value': judgment.value,
-                        'informativeness': calculate_informativeness(judgment.n_gradations),
-                        'scale_history': [
-                            {'scale_type': st.value, 'n_gradations': n}
-                            for st, n in judgment.scale_history
-                        ]
-                    }
-                    scale_transformations.append(entry)
-
-            transformations_file = os.path.join(directory, "scale_transformations.json")
-            with open(transformations_file, 'w', encoding='utf-8') as f:
-                json.dump(scale_transformations, f, ensure_ascii=False, indent=2)
+            # Файли незалежні, тому записуються паралельно; result() повертає
+            # першу помилку запису в обробник нижче
+            writers = (
+                self._write_weights,
+                self._write_consistency,
+                self._write_suggestions,
+                self._write_scale_transformations,
+            )
+            with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                futures = [executor.submit(write, results, directory) for write in writers]
+                for future in futures:
+                    future.result()
 
             messagebox.showinfo(
                 "Успіх",
@@ -315,3 +292,55 @@ class MainController:
 
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося експортувати результати:\n{e}")
+
+    def _write_weights(self, results: Dict, directory: str):
+        """1. Експорт ваг у CSV"""
+        weights_file = os.path.join(directory, "weights.csv")
+        with open(weights_file, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
+            writer = csv.writer(f)
+            writer.writerow(['rank', 'alternative', 'weight'])
+            writer.writerows(
+                [item['rank'], item['alternative'], f"{item['weight']:.6f}"]
+                for item in results['ranking']
+            )
+
+    def _write_consistency(self, results: Dict, directory: str):
+        """2. Експорт узгодженості у JSON"""
+        consistency_file = os.path.join(directory, "consistency.json")
+        consistency_data = {
+            'consistency_analysis': results['consistency'],
+            'matrix_size': len(self.session.alternatives),
+            'alternatives': self.session.alternatives,
+            'aggregated_matrix': results['aggregated_matrix']
+        }
+        dump_json(consistency_data, consistency_file)
+
+    def _write_suggestions(self, results: Dict, directory: str):
+        """3. Експорт рекомендацій у JSON"""
+        suggestions_file = os.path.join(directory, "suggestions.json")
+        dump_json(results['suggestions'], suggestions_file)
+
+    def _write_scale_transformations(self, results: Dict, directory: str):
+        """4. Експорт трансформацій шкал"""
+        transformations_file = os.path.join(directory, "scale_transformations.json")
+        dump_json_array(self._iter_scale_transformations(), transformations_file)
+
+    def _iter_scale_transformations(self):
+        """Генерує записи трансформацій шкал по одному для потокового запису"""
+        informativeness = calculate_informativeness
+        for expert in self.session.experts:
+            for judgment in expert.judgments:
+                yield {
+                    'expert_id': expert.expert_id,
+                    'comparison': f"{judgment.alt_i} vs {judgment.alt_j}",
+                    'alt_i': judgment.alt_i,
+                    'alt_j': judgment.alt_j,
+                    'scale_type': judgment.scale_type.value,
+                    'n_gradations': judgment.n_gradations,
+                    'value': judgment.value,
+                    'informativeness': informativeness(judgment.n_gradations),
+                    'scale_history': [
+                        {'scale_type': st.value, 'n_gradations': n}
+                        for st, n in judgment.scale_history
+                    ]
+                }
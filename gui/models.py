@@ -3,43 +3,103 @@
 Забезпечує зв'язок між інтерфейсом користувача та логікою попарних порівнянь
 """
 
+import codecs
 import json
+import math
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple, Optional
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+# Опціонально використовуємо orjson (швидша серіалізація), інакше stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Опціонально: msgpack для швидких бінарних контрольних точок сесії
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-from scales import ScaleType, get_scale_values, calculate_informativeness, unify_judgment
-from pcm import PairwiseComparisonMatrix, PCMStatus
-from consistency import (
-    consistency_spectral,
-    calculate_weights_eigenvector,
-    generate_revision_suggestions,
-    rank_weights
+
+# Кореневі модулі (scales, pcm, ...) мають бути доступні для імпорту; шлях
+# додається лише якщо його ще немає, щоб не дублювати записи sys.path
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
+
+from scales import (
+    ScaleType, SCALE_GRADATIONS_RANGE, get_scale_values, calculate_informativeness,
+    unify_judgment
 )
-from aggregate import group_aggregate, aggregate_with_statistics
+# dump_json / dump_json_array спільні з main.py; тут реекспортуються для контролерів
+from jsonio import json_default, dump_json, dump_json_array
+
+# pcm, consistency та aggregate (разом з опціональним numba) імпортуються ліниво
+# у build_pcm_list / calculate_results: стартовому вікну GUI вони не потрібні
+if TYPE_CHECKING:
+    from pcm import PairwiseComparisonMatrix
+
+
+def load_json(filename: str) -> Any:
+    """
+    Завантажує дані з JSON файлу (або з контрольної точки msgpack, див.
+    SessionModel.save_checkpoint)
+
+    Args:
+        filename: Шлях до файлу
+
+    Returns:
+        Розібрані дані
+    """
+    with open(filename, 'rb') as f:
+        raw = f.read()
 
+    # Редактори Windows додають на початок UTF-8 BOM; JSON-парсери його не приймають
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
 
-@dataclass
+    # JSON-документ сесії починається з '{'; інакше це контрольна точка msgpack
+    if msgpack is not None and raw.lstrip()[:1] not in (b'{', b'['):
+        return msgpack.unpackb(raw, raw=False)
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+@dataclass(slots=True)
 class Alternative:
     """Альтернатива для порівняння"""
     name: str
     index: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Judgment:
-    """Експертна оцінка порівняння"""
+    """
+    Експертна оцінка порівняння.
+    Незмінна: оцінки дзеркалюються у стовпчиках Expert і ключах кешів
+    SessionModel, тож змінену оцінку додають заново через add_judgment
+    """
     alt_i: str
     alt_j: str
     value: float
     scale_type: ScaleType
     n_gradations: int
-    scale_history: List[Tuple[ScaleType, int]] = field(default_factory=list)
+    # Історія змін шкали; за замовчуванням спільний порожній кортеж замість
+    # окремого списку на кожну оцінку (історію замінюють цілком, а не доповнюють)
+    scale_history: Sequence[Tuple[ScaleType, int]] = ()
+
+    def __post_init__(self):
+        # Значення завжди float: від цього залежить формат серіалізації
+        object.__setattr__(self, 'value', float(self.value))
 
     def to_dict(self) -> dict:
         """Конвертує оцінку в словник для серіалізації"""
@@ -53,12 +113,153 @@ class Judgment:
         }
 
 
-@dataclass
+# Коди шкал для стовпчикового зберігання оцінок (int8 -> ScaleType)
+_SCALE_TYPES: Tuple[ScaleType, ...] = tuple(ScaleType)
+_SCALE_CODES: Dict[ScaleType, int] = {st: code for code, st in enumerate(_SCALE_TYPES)}
+_SCALE_TYPES_ARRAY = np.array(_SCALE_TYPES, dtype=object)
+
+
+def _empty_column(dtype):
+    return field(default_factory=lambda: np.empty(0, dtype=dtype),
+                 init=False, repr=False, compare=False)
+
+
+@dataclass(slots=True)
 class Expert:
-    """Експерт з коефіцієнтом компетентності"""
+    """
+    Експерт з коефіцієнтом компетентності.
+
+    Крім списку judgments, оцінки дзеркально зберігаються стовпчиками NumPy
+    (індекси альтернатив, значення, коди шкал, градації) - з них build_pcm_list
+    будує МПП без обходу об'єктів Judgment. Індекси альтернатив заповнюються,
+    якщо задано alt_index (встановлює SessionModel)
+    """
     expert_id: str
     competence: float = 1.0
     judgments: List[Judgment] = field(default_factory=list)
+    alt_index: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+    # (alt_i, alt_j) -> позиція оцінки у judgments, для O(1) пошуку та видалення
+    _judgment_index: Dict[Tuple[str, str], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Стовпчики оцінок (ємність подвоюється; дійсні перші len(judgments) елементів)
+    _alt_i: np.ndarray = _empty_column(np.int32)
+    _alt_j: np.ndarray = _empty_column(np.int32)
+    _values: np.ndarray = _empty_column(np.float64)
+    _scale_codes: np.ndarray = _empty_column(np.int8)
+    _n_gradations: np.ndarray = _empty_column(np.int8)
+    # Оцінки, відображені у стовпчиках та _judgment_index; відмінність від
+    # judgments означає, що список змінили напряму, і стовпчики треба перебудувати
+    _synced: List[Judgment] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._resync()
+
+    def _resync(self):
+        """Перебудовує _judgment_index та стовпчики з поточного списку judgments"""
+        self._judgment_index.clear()
+        self._reserve(len(self.judgments))
+        for idx, judgment in enumerate(self.judgments):
+            self._judgment_index[(judgment.alt_i, judgment.alt_j)] = idx
+            self._store_columns(idx, judgment)
+        self._synced = list(self.judgments)
+
+    def _ensure_synced(self):
+        """Перебудовує стовпчики, якщо judgments змінили в обхід add/remove_judgment"""
+        # Порівняння списків спершу перевіряє тотожність елементів, тож у
+        # звичайному випадку це лише прохід по вказівниках
+        if self._synced != self.judgments:
+            self._resync()
+
+    def bind_alternatives(self, alt_index: Dict[str, int]):
+        """Задає відображення назва -> індекс альтернативи та оновлює стовпчики індексів"""
+        self.alt_index = alt_index
+        for idx, judgment in enumerate(self.judgments):
+            self._store_columns(idx, judgment)
+
+    def _reserve(self, size: int):
+        """Забезпечує ємність стовпчиків не менше size"""
+        capacity = self._values.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(size, 2 * capacity, 8)
+        for name in ('_alt_i', '_alt_j', '_values', '_scale_codes', '_n_gradations'):
+            old = getattr(self, name)
+            column = np.empty(new_capacity, dtype=old.dtype)
+            column[:capacity] = old
+            setattr(self, name, column)
+
+    def _store_columns(self, idx: int, judgment: Judgment):
+        """Записує оцінку у стовпчики на позицію idx"""
+        alt_index = self.alt_index
+        if alt_index is not None:
+            self._alt_i[idx] = alt_index[judgment.alt_i]
+            self._alt_j[idx] = alt_index[judgment.alt_j]
+        self._values[idx] = judgment.value
+        self._scale_codes[idx] = _SCALE_CODES[judgment.scale_type]
+        self._n_gradations[idx] = judgment.n_gradations
+
+    def judgment_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Повертає оцінки стовпчиками
+
+        Returns:
+            (індекси alt_i, індекси alt_j, значення, типи шкал, градації)
+        """
+        self._ensure_synced()
+        size = len(self.judgments)
+        return (
+            self._alt_i[:size],
+            self._alt_j[:size],
+            self._values[:size],
+            _SCALE_TYPES_ARRAY[self._scale_codes[:size]],
+            self._n_gradations[:size],
+        )
+
+    def add_judgment(self, judgment: Judgment):
+        """Додає оцінку; повторна оцінка тієї ж пари замінює попередню"""
+        self._ensure_synced()
+        key = (judgment.alt_i, judgment.alt_j)
+        idx = self._judgment_index.get(key)
+        if idx is None:
+            idx = len(self.judgments)
+            self._reserve(idx + 1)
+            self._judgment_index[key] = idx
+            self.judgments.append(judgment)
+            self._synced.append(judgment)
+        else:
+            self.judgments[idx] = judgment
+            self._synced[idx] = judgment
+        self._store_columns(idx, judgment)
+
+    def remove_judgment(self, alt_i: str, alt_j: str) -> Optional[Judgment]:
+        """
+        Видаляє оцінку пари (swap-pop, O(1))
+
+        Returns:
+            Видалена оцінка або None, якщо пару не оцінено
+        """
+        self._ensure_synced()
+        idx = self._judgment_index.pop((alt_i, alt_j), None)
+        if idx is None:
+            return None
+
+        removed = self.judgments[idx]
+        last = self.judgments.pop()
+        self._synced.pop()
+        if idx < len(self.judgments):
+            self.judgments[idx] = last
+            self._synced[idx] = last
+            self._judgment_index[(last.alt_i, last.alt_j)] = idx
+            self._store_columns(idx, last)
+        return removed
+
+    def judgments_key(self) -> tuple:
+        """Вміст оцінок експерта як хешований кортеж (ключ кешів SessionModel)"""
+        return tuple(
+            (j.alt_i, j.alt_j, j.value, j.scale_type, j.n_gradations)
+            for j in self.judgments
+        )
 
     def to_dict(self) -> dict:
         """Конвертує експерта в словник"""
@@ -80,7 +281,22 @@ class SessionModel:
         self.experts: List[Expert] = []
         self.current_expert_idx: int = 0
         self.current_pair_idx: int = 0
-        self.all_pairs: List[Tuple[str, str]] = []
+
+        # Пари (i < j) не зберігаються: пара обчислюється за номером у
+        # порядку np.triu_indices, достатньо кількості альтернатив і пар
+        self._n_alternatives: int = 0
+        self._n_pairs: int = 0
+        self._alt_to_idx: Dict[str, int] = {}
+        # Кількість експертів кешується для методів, що викликаються при кожному
+        # оновленні вікна; оновлюється при ініціалізації та завантаженні сесії
+        self._n_experts: int = 0
+        # Лічильники прогресу: пройдені пари (оновлюється при навігації) та всього пар
+        self._completed: int = 0
+        self._total: int = 0
+        # Побудовані МПП: expert_id -> (експерт, Expert.judgments_key(), МПП)
+        self._pcm_cache: Dict[str, Tuple[Expert, tuple, 'PairwiseComparisonMatrix']] = {}
+        # Результати останнього calculate_results разом з відбитком оцінок
+        self._results_cache: Optional[Tuple[tuple, Dict]] = None
 
     def initialize_session(self, alternatives: List[str], expert_ids: List[str],
                           competence_coefficients: Optional[Dict[str, float]] = None):
@@ -93,7 +309,7 @@ class SessionModel:
             competence_coefficients: Коефіцієнти компетентності
         """
         self.alternatives = alternatives
-        self.all_pairs = self._generate_pairs(alternatives)
+        self._set_pairs(alternatives)
 
         # Створюємо експертів
         self.experts = []
@@ -101,28 +317,67 @@ class SessionModel:
             competence = 1.0
             if competence_coefficients and expert_id in competence_coefficients:
                 competence = competence_coefficients[expert_id]
-            self.experts.append(Expert(expert_id, competence))
+            self.experts.append(Expert(expert_id, competence, alt_index=self._alt_to_idx))
+        self._n_experts = len(self.experts)
+        self._total = self._n_experts * self._n_pairs
 
         self.current_expert_idx = 0
         self.current_pair_idx = 0
-
-    def _generate_pairs(self, alternatives: List[str]) -> List[Tuple[str, str]]:
-        """Генерує всі пари альтернатив для порівняння"""
-        pairs = []
-        for i in range(len(alternatives)):
-            for j in range(i + 1, len(alternatives)):
-                pairs.append((alternatives[i], alternatives[j]))
-        return pairs
+        self._completed = 0
+
+    def _generate_pairs(self, alternatives: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Генерує індекси (i, j), i < j, всіх пар альтернатив для порівняння"""
+        pair_i, pair_j = np.triu_indices(len(alternatives), k=1)
+        return pair_i.astype(np.int32), pair_j.astype(np.int32)
+
+    def _set_pairs(self, alternatives: List[str]):
+        """Оновлює кількість пар для заданих альтернатив"""
+        n = len(alternatives)
+        self._n_alternatives = n
+        self._n_pairs = n * (n - 1) // 2
+        self._alt_to_idx = {alt: k for k, alt in enumerate(alternatives)}
+
+    @property
+    def alt_index(self) -> Dict[str, int]:
+        """Відображення назва -> індекс альтернативи (одне на сесію, не змінювати)"""
+        return self._alt_to_idx
+
+    def _pair_at(self, k: int) -> Tuple[int, int]:
+        """
+        Індекси (i, j) k-ї пари у порядку np.triu_indices(n, k=1), за формулою
+        без побудови списку пар (isqrt дає точний результат для будь-якого n)
+        """
+        n = self._n_alternatives
+        i = n - 2 - (math.isqrt(4 * n * (n - 1) - 8 * k - 7) - 1) // 2
+        j = k + i + 1 - n * (n - 1) // 2 + (n - i) * (n - i - 1) // 2
+        return i, j
+
+    @property
+    def all_pairs(self) -> List[Tuple[str, str]]:
+        """Всі пари альтернатив для порівняння (будуються на вимогу)"""
+        pair_i, pair_j = self._generate_pairs(self.alternatives)
+        return [
+            (self.alternatives[i], self.alternatives[j])
+            for i, j in zip(pair_i.tolist(), pair_j.tolist())
+        ]
 
     def get_current_pair(self) -> Optional[Tuple[str, str]]:
         """Повертає поточну пару для порівняння"""
-        if self.current_pair_idx < len(self.all_pairs):
-            return self.all_pairs[self.current_pair_idx]
+        idx = self.current_pair_idx
+        if 0 <= idx < self._n_pairs:
+            i, j = self._pair_at(idx)
+            return (self.alternatives[i], self.alternatives[j])
         return None
 
+    def set_competence(self, expert_id: str, competence: float):
+        """Змінює коефіцієнт компетентності експерта"""
+        for expert in self.experts:
+            if expert.expert_id == expert_id:
+                expert.competence = competence
+
     def get_current_expert(self) -> Optional[Expert]:
         """Повертає поточного експерта"""
-        if 0 <= self.current_expert_idx < len(self.experts):
+        if 0 <= self.current_expert_idx < self._n_experts:
             return self.experts[self.current_expert_idx]
         return None
 
@@ -130,7 +385,7 @@ class SessionModel:
         """Додає експертну оцінку"""
         expert = self.get_current_expert()
         if expert:
-            expert.judgments.append(judgment)
+            expert.add_judgment(judgment)
 
     def next_pair(self) -> bool:
         """
@@ -140,7 +395,8 @@ class SessionModel:
             True якщо є наступна пара, False якщо закінчились пари
         """
         self.current_pair_idx += 1
-        if self.current_pair_idx >= len(self.all_pairs):
+        self._completed += 1
+        if self.current_pair_idx >= self._n_pairs:
             # Переходимо до наступного експерта
             return self.next_expert()
         return True
@@ -154,10 +410,12 @@ class SessionModel:
         """
         if self.current_pair_idx > 0:
             self.current_pair_idx -= 1
+            self._completed -= 1
             return True
         elif self.current_expert_idx > 0:
             self.current_expert_idx -= 1
-            self.current_pair_idx = len(self.all_pairs) - 1
+            self.current_pair_idx = self._n_pairs - 1
+            self._completed -= 1
             return True
         return False
 
@@ -170,7 +428,8 @@ class SessionModel:
         """
         self.current_expert_idx += 1
         self.current_pair_idx = 0
-        return self.current_expert_idx < len(self.experts)
+        self._completed = self.current_expert_idx * self._n_pairs
+        return self.current_expert_idx < self._n_experts
 
     def get_progress(self) -> Tuple[int, int]:
         """
@@ -179,58 +438,112 @@ class SessionModel:
         Returns:
             (completed_pairs, total_pairs)
         """
-        completed = self.current_expert_idx * len(self.all_pairs) + self.current_pair_idx
-        total = len(self.experts) * len(self.all_pairs)
-        return (completed, total)
+        return (self._completed, self._total)
 
     def is_complete(self) -> bool:
         """Перевіряє чи завершено всі порівняння"""
-        return self.current_expert_idx >= len(self.experts)
+        return self.current_expert_idx >= self._n_experts
 
-    def build_pcm_list(self) -> List[PairwiseComparisonMatrix]:
-        """Будує список МПП для всіх експертів"""
-        pcm_list = []
+    def build_pcm_list(self, judgment_keys: Optional[Sequence[tuple]] = None
+                       ) -> List['PairwiseComparisonMatrix']:
+        """
+        Будує список МПП для всіх експертів.
+        Перебудовуються лише МПП експертів, чиї оцінки змінились з попереднього
+        виклику; для решти повертаються збережені (їх не слід змінювати)
 
-        for expert in self.experts:
-            judgments_dict = [j.to_dict() for j in expert.judgments]
-            pcm = PairwiseComparisonMatrix.from_judgments(
-                self.alternatives,
-                judgments_dict,
-                expert.expert_id
-            )
+        Args:
+            judgment_keys: Expert.judgments_key() кожного експерта, якщо вже
+                обчислені (calculate_results бере їх з відбитку)
+        """
+        if judgment_keys is None:
+            judgment_keys = [expert.judgments_key() for expert in self.experts]
+
+        pcm_list = [None] * len(self.experts)
+        dirty = []
+        for position, expert in enumerate(self.experts):
+            cached = self._pcm_cache.get(expert.expert_id)
+            if (cached is not None and cached[0] is expert
+                    and cached[1] == judgment_keys[position]
+                    and expert.alt_index is self._alt_to_idx):
+                pcm_list[position] = cached[2]
+            else:
+                dirty.append(position)
+
+        if len(dirty) <= 1:
+            built = [self._build_expert_pcm(self.experts[position]) for position in dirty]
+        else:
+            # МПП експертів незалежні; заповнення (NumPy / numba nogil) відпускає GIL
+            with ThreadPoolExecutor(max_workers=min(8, len(dirty))) as executor:
+                built = list(executor.map(
+                    self._build_expert_pcm, [self.experts[position] for position in dirty]
+                ))
+
+        for position, pcm in zip(dirty, built):
+            expert = self.experts[position]
+            self._pcm_cache[expert.expert_id] = (expert, judgment_keys[position], pcm)
+            pcm_list[position] = pcm
 
-            # Заповнюємо неповні МПП через транзитивність
-            if pcm.get_status() == PCMStatus.INCOMPLETE and pcm.check_connectivity():
-                pcm.fill_transitive()
+        return pcm_list
 
-            pcm_list.append(pcm)
+    def _build_expert_pcm(self, expert: Expert) -> 'PairwiseComparisonMatrix':
+        """Будує МПП одного експерта та заповнює її транзитивно, якщо можливо"""
+        from pcm import PairwiseComparisonMatrix, PCMStatus
 
-        return pcm_list
+        if expert.alt_index is not self._alt_to_idx:
+            # Експерт створений поза сесією - прив'язуємо індекси альтернатив
+            expert.bind_alternatives(self._alt_to_idx)
+
+        pcm = PairwiseComparisonMatrix.from_arrays(
+            self.alternatives, *expert.judgment_columns(), expert.expert_id
+        )
+
+        # Заповнюємо неповні МПП через транзитивність
+        if pcm.get_status() == PCMStatus.INCOMPLETE and pcm.check_connectivity():
+            pcm.fill_transitive()
+
+        return pcm
+
+    def _results_inputs(self) -> Tuple[tuple, Dict[str, float]]:
+        """
+        Відбиток усіх вхідних даних calculate_results (альтернативи, експерти,
+        оцінки) та коефіцієнти компетентності expert_id -> competence, зібрані
+        за один прохід: ключ кешу та дані для агрегації мають одне джерело
+        """
+        competence = {}
+        experts = []
+        for expert in self.experts:
+            competence[expert.expert_id] = expert.competence
+            experts.append((expert.expert_id, expert.competence, expert.judgments_key()))
+        return (tuple(self.alternatives), *experts), competence
 
     def calculate_results(self) -> Dict:
         """
-        Обчислює остаточні результати
+        Обчислює остаточні результати.
+        Повторний виклик без змін в оцінках повертає збережений результат
 
         Returns:
             Словник з результатами: ваги, узгодженість, рекомендації
         """
-        pcm_list = self.build_pcm_list()
+        fingerprint, competence = self._results_inputs()
+        if self._results_cache is not None and self._results_cache[0] == fingerprint:
+            return self._results_cache[1]
 
-        # Коефіцієнти компетентності
-        competence_coefficients = {
-            expert.expert_id: expert.competence
-            for expert in self.experts
-        }
+        from consistency import (
+            consistency_and_weights,
+            generate_revision_suggestions,
+            rank_weights
+        )
+        from aggregate import aggregate_with_statistics
 
-        # Агрегація
-        aggregation_result = aggregate_with_statistics(pcm_list, competence_coefficients)
-        aggregated_matrix = aggregation_result['aggregated_matrix']
+        pcm_list = self.build_pcm_list([entry[2] for entry in fingerprint[1:]])
 
-        # Узгодженість
-        consistency = consistency_spectral(aggregated_matrix)
+        # Агрегація з коефіцієнтами компетентності, врахованими у відбитку
+        aggregation_result = aggregate_with_statistics(pcm_list, competence)
+        aggregated_matrix = aggregation_result['aggregated_matrix']
 
-        # Ваги
-        weights = calculate_weights_eigenvector(aggregated_matrix)
+        # Узгодженість та ваги з одного розрахунку власного вектора
+        consistency = consistency_and_weights(aggregated_matrix)
+        weights = consistency.pop('weights')
 
         # Ранжування
         ranking = rank_weights(weights, self.alternatives)
@@ -244,7 +557,7 @@ class SessionModel:
                 top_k=5
             )
 
-        return {
+        results = {
             'aggregated_matrix': aggregated_matrix,
             'consistency': consistency,
             'weights': weights,
@@ -253,68 +566,128 @@ class SessionModel:
             'expert_weights': aggregation_result['expert_weights'],
             'expert_statistics': aggregation_result['expert_statistics']
         }
+        self._results_cache = (fingerprint, results)
+        return results
+
+    def _session_data(self) -> Dict:
+        """Дані сесії для серіалізації (спільні для save_session та save_checkpoint)"""
+        # Один прохід по експертах для обох полів
+        experts_data = []
+        competence_coefficients = {}
+        for expert in self.experts:
+            # Оцінки передаються як є: orjson серіалізує dataclass напряму,
+            # stdlib json - через json_default (Judgment.to_dict)
+            experts_data.append({
+                'expert_id': expert.expert_id,
+                'competence': expert.competence,
+                'judgments': expert.judgments
+            })
+            competence_coefficients[expert.expert_id] = expert.competence
 
-    def save_session(self, filename: str):
-        """Зберігає сесію у JSON файл"""
-        session_data = {
+        return {
             'alternatives': self.alternatives,
-            'experts': [expert.to_dict() for expert in self.experts],
-            'competence_coefficients': {
-                expert.expert_id: expert.competence
-                for expert in self.experts
-            },
+            'experts': experts_data,
+            'competence_coefficients': competence_coefficients,
             'current_expert_idx': self.current_expert_idx,
             'current_pair_idx': self.current_pair_idx
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, ensure_ascii=False, indent=2)
+    def save_session(self, filename: str):
+        """Зберігає сесію у JSON файл"""
+        dump_json(self._session_data(), filename)
+
+    def save_checkpoint(self, filename: str):
+        """
+        Зберігає проміжну контрольну точку сесії: msgpack, якщо доступний,
+        інакше компактний JSON без відступів. Читається тим самим load_session
+        """
+        session_data = self._session_data()
+        if msgpack is not None:
+            with open(filename, 'wb') as f:
+                f.write(msgpack.packb(session_data, default=json_default, use_bin_type=True))
+        elif orjson is not None:
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(session_data, default=json_default, option=options))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(session_data, f, ensure_ascii=False, separators=(',', ':'),
+                          default=json_default)
 
     @staticmethod
     def load_session(filename: str) -> 'SessionModel':
         """Завантажує сесію з JSON файлу"""
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(filename)
 
         session = SessionModel()
         session.alternatives = data['alternatives']
-        session.all_pairs = session._generate_pairs(session.alternatives)
+        session._set_pairs(session.alternatives)
+
+        # Пошук ScaleType за значенням через словник, без виклику Enum на кожну оцінку
+        scale_types = {st.value: st for st in ScaleType}
 
         # Завантажуємо експертів
         session.experts = []
         for expert_data in data['experts']:
             expert = Expert(
                 expert_id=expert_data['expert_id'],
-                competence=expert_data.get('competence', 1.0)
+                competence=expert_data.get('competence', 1.0),
+                alt_index=session._alt_to_idx
             )
 
             # Завантажуємо оцінки
             for judgment_data in expert_data['judgments']:
-                scale_type = ScaleType(judgment_data['scale_type'])
+                scale_type = scale_types[judgment_data['scale_type']]
+                # Історія шкал (оцінка незмінна, тож передається одразу)
+                scale_history = tuple(
+                    (scale_types[st], n) for st, n in judgment_data.get('scale_history', ())
+                )
                 judgment = Judgment(
                     alt_i=judgment_data['alt_i'],
                     alt_j=judgment_data['alt_j'],
                     value=judgment_data['value'],
                     scale_type=scale_type,
-                    n_gradations=judgment_data['n_gradations']
+                    n_gradations=judgment_data['n_gradations'],
+                    scale_history=scale_history
                 )
 
-                # Завантажуємо історію шкал
-                if 'scale_history' in judgment_data:
-                    judgment.scale_history = [
-                        (ScaleType(st), n) for st, n in judgment_data['scale_history']
-                    ]
-
-                expert.judgments.append(judgment)
+                expert.add_judgment(judgment)
 
             session.experts.append(expert)
+        session._n_experts = len(session.experts)
+        session._total = session._n_experts * session._n_pairs
 
         session.current_expert_idx = data.get('current_expert_idx', 0)
         session.current_pair_idx = data.get('current_pair_idx', 0)
+        session._completed = (session.current_expert_idx * session._n_pairs
+                              + session.current_pair_idx)
 
         return session
 
 
+# Доступні в GUI шкали з описами; будується один раз при імпорті модуля
+_AVAILABLE_SCALES: Tuple[Tuple[ScaleType, str], ...] = (
+    (ScaleType.ORDINAL, "Ординальна (2 градації)"),
+    (ScaleType.SAATY_5, "Сааті-5 (5 градацій)"),
+    (ScaleType.SAATY_9, "Сааті-9 (9 градацій)"),
+    (ScaleType.BALANCED, "Збалансована (3-9 градацій)"),
+    (ScaleType.POWER, "Степенева (3-9 градацій)"),
+)
+
+
+def _precompute_scale_values() -> Dict[Tuple[ScaleType, int], Tuple[float, ...]]:
+    """Значення всіх шкал для всіх допустимих кількостей градацій"""
+    table = {}
+    for scale_type in ScaleType:
+        min_grad, max_grad = SCALE_GRADATIONS_RANGE.get(scale_type, (3, 9))
+        for n_gradations in range(min_grad, max_grad + 1):
+            try:
+                table[(scale_type, n_gradations)] = get_scale_values(scale_type, n_gradations)
+            except ValueError:
+                pass
+    return table
+
+
 class ScaleManager:
     """
     Менеджер для роботи зі шкалами та адаптивним уточненням.
@@ -341,24 +714,22 @@ class ScaleManager:
         ScaleType.DONEGAN: {}
     }
 
+    # Значення шкал обчислюються один раз при імпорті: (шкала, градації) -> значення
+    SCALE_VALUES = _precompute_scale_values()
+
     @staticmethod
-    def get_available_scales() -> List[Tuple[ScaleType, str]]:
-        """Повертає список доступних шкал з описами"""
-        return [
-            (ScaleType.ORDINAL, "Ординальна (2 градації)"),
-            (ScaleType.SAATY_5, "Сааті-5 (5 градацій)"),
-            (ScaleType.SAATY_9, "Сааті-9 (9 градацій)"),
-            (ScaleType.BALANCED, "Збалансована (3-9 градацій)"),
-            (ScaleType.POWER, "Степенева (3-9 градацій)"),
-        ]
+    def get_available_scales() -> Tuple[Tuple[ScaleType, str], ...]:
+        """Повертає доступні шкали з описами (незмінний кортеж, спільний для всіх викликів)"""
+        return _AVAILABLE_SCALES
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_scale_gradations_range(scale_type: ScaleType) -> Tuple[int, int]:
         """Повертає діапазон градацій для шкали"""
-        from scales import SCALE_GRADATIONS_RANGE
         return SCALE_GRADATIONS_RANGE.get(scale_type, (3, 9))
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_linguistic_label(scale_type: ScaleType, n_gradations: int,
                             grade_index: int) -> str:
         """
@@ -371,6 +742,10 @@ class ScaleManager:
 
         Returns:
             Лінгвістична мітка
+
+        Note:
+            Результат кешується: мітка залежить лише від (шкала, градації, індекс),
+            а метод викликається при кожному оновленні вікна порівняння.
         """
         if scale_type in ScaleManager.LINGUISTIC_LABELS:
             labels_dict = ScaleManager.LINGUISTIC_LABELS[scale_type]
@@ -380,7 +755,9 @@ class ScaleManager:
                     return labels[grade_index]
 
         # Генеруємо числову мітку за замовчуванням
-        values = get_scale_values(scale_type, n_gradations)
+        values = ScaleManager.SCALE_VALUES.get((scale_type, n_gradations))
+        if values is None:
+            values = get_scale_values(scale_type, n_gradations)
         if 0 <= grade_index < len(values):
             return f"Градація {grade_index + 1} (≈ {values[grade_index]:.1f})"
 
@@ -405,9 +782,9 @@ class ScaleManager:
             return (scale_type, min(n_gradations + 2, max_grad))
 
         # Або запропонувати перехід на іншу шкалу з більшою деталізацією
-        if scale_type == ScaleType.ORDINAL:
+        if scale_type is ScaleType.ORDINAL:
             return (ScaleType.SAATY_5, 3)
-        elif scale_type == ScaleType.SAATY_5 and n_gradations < 9:
+        elif scale_type is ScaleType.SAATY_5 and n_gradations < 9:
             return (ScaleType.SAATY_9, 7)
 
         return None
@@ -7,8 +7,47 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 from typing import Optional, Callable, List, Tuple, Dict
 import os
+import codecs
+from array import array
+from operator import itemgetter
 
-from models import ScaleType, ScaleManager
+from .models import ScaleType, ScaleManager
+from scales import get_scale_values, calculate_informativeness
+
+# Розмір блоку тексту, що вставляється в поле за один idle-цикл
+_READ_CHUNK_SIZE = 1 << 16
+
+# Доступні шкали та описи для списку, обчислені один раз; порядок описів
+# збігається з порядком шкал, тож індекс вибору в списку - індекс у _SCALES
+_SCALES = ScaleManager.get_available_scales()
+_SCALE_OPTIONS = tuple(desc for _, desc in _SCALES)
+
+# Кількість рядків списку експертів, видимих до першого перерахунку розміру
+_EXPERTS_VISIBLE_ROWS = 5
+
+# Поля рядка ранжування у порядку колонок таблиці ваг
+_RANKING_FIELDS = itemgetter('rank', 'alternative', 'weight')
+
+# Затримка оновлення інформації про градацію під час перетягування слайдера, мс
+_SLIDER_DEBOUNCE_MS = 30
+
+
+def _text_replace(widget: tk.Text, content: str):
+    """Замінює весь вміст текстового поля одним викликом Tcl (delete + insert)"""
+    widget.replace("1.0", tk.END, content)
+
+
+def _unbind_handler(widget: tk.Misc, sequence: str, funcid: str):
+    """
+    Знімає з віджета лише обробник funcid для події sequence.
+    Misc.unbind(sequence, funcid) (до Python 3.13) очищає всі прив'язки
+    послідовності, тому зі скрипту прив'язки вилучаються тільки рядки
+    виклику funcid, а решта прив'язується знову
+    """
+    script = widget.bind(sequence)
+    kept = [line for line in script.split('\n') if line and f'[{funcid} ' not in line]
+    widget.bind(sequence, '\n'.join(kept))
+    widget.deletecommand(funcid)
 
 
 class StartWindow(tk.Frame):
@@ -69,9 +108,16 @@ class ProjectSetupWindow(tk.Frame):
     def __init__(self, parent, on_start_comparison: Callable):
         super().__init__(parent)
         self.on_start_comparison = on_start_comparison
+        # Ідентифікатор відкладеної (after_idle) вставки наступного блоку CSV
+        self._pending_chunks: Optional[str] = None
 
         self._setup_ui()
 
+    def destroy(self):
+        """Скасовує незавершену вставку блоків CSV перед знищенням вікна"""
+        self._cancel_chunks()
+        super().destroy()
+
     def _setup_ui(self):
         """Налаштування інтерфейсу"""
         # Заголовок
@@ -95,6 +141,10 @@ class ProjectSetupWindow(tk.Frame):
         )
         self.alternatives_text.pack(fill=tk.BOTH, expand=True, pady=5)
 
+        # Розібрані альтернативи кешуються до наступної зміни тексту
+        self._alt_cache: Optional[List[str]] = None
+        self.alternatives_text.bind('<<Modified>>', self._on_alt_modified)
+
         # Кнопки завантаження
         btn_frame = tk.Frame(alt_frame)
         btn_frame.pack(fill=tk.X, pady=5)
@@ -115,10 +165,35 @@ class ProjectSetupWindow(tk.Frame):
         expert_frame = ttk.LabelFrame(self, text="Експерти", padding=10)
         expert_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        # Список експертів
-        self.experts_list = []
-        self.experts_listbox = tk.Listbox(expert_frame, height=5)
-        self.experts_listbox.pack(fill=tk.BOTH, expand=True, pady=5)
+        # Список експертів: паралельні масиви ID та коефіцієнтів компетентності
+        self._expert_ids: List[str] = []
+        self._expert_comps = array('d')
+
+        # Віртуальний список: у Treeview існують лише видимі рядки, а
+        # прокрутка зсуває вікно перегляду над масивами експертів
+        self._experts_offset = 0
+        self._experts_rows = _EXPERTS_VISIBLE_ROWS
+        list_frame = tk.Frame(expert_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        self.experts_scrollbar = ttk.Scrollbar(
+            list_frame,
+            orient=tk.VERTICAL,
+            command=self._on_experts_scroll
+        )
+        self.experts_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.experts_view = ttk.Treeview(
+            list_frame,
+            show='tree',
+            selectmode='browse',
+            height=_EXPERTS_VISIBLE_ROWS
+        )
+        self.experts_view.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.experts_view.bind('<Configure>', self._on_experts_resize)
+        self.experts_view.bind('<MouseWheel>', self._on_experts_wheel)
+        self.experts_view.bind('<Button-4>', lambda e: self._scroll_experts(-1))
+        self.experts_view.bind('<Button-5>', lambda e: self._scroll_experts(1))
 
         # Форма додавання експерта
         add_expert_frame = tk.Frame(expert_frame)
@@ -161,25 +236,51 @@ class ProjectSetupWindow(tk.Frame):
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         if filename:
+            # Незавершена вставка попереднього файлу не має дописатися до нового
+            self._cancel_chunks()
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.alternatives_text.delete(1.0, tk.END)
-                self.alternatives_text.insert(1.0, content)
+                # Файл читається в бінарному режимі одним викликом і декодується
+                # одним bytes.decode; BOM відкидається, а некоректні байти
+                # замінюються символом U+FFFD замість помилки
+                with open(filename, 'rb') as f:
+                    raw = f.read()
+                if raw.startswith(codecs.BOM_UTF8):
+                    raw = raw[len(codecs.BOM_UTF8):]
+                content = raw.decode('utf-8', errors='replace')
+                chunks = [
+                    content[start:start + _READ_CHUNK_SIZE]
+                    for start in range(0, len(content), _READ_CHUNK_SIZE)
+                ]
+
+                # Перший блок замінює старий вміст, решта дописується в idle-циклах
+                _text_replace(self.alternatives_text, chunks[0] if chunks else '')
+                self._insert_chunks(chunks, 1)
             except Exception as e:
                 messagebox.showerror("Помилка", f"Не вдалося завантажити файл:\n{e}")
 
+    def _insert_chunks(self, chunks: List[str], index: int = 0):
+        """Вставляє текст блоками, по одному за idle-цикл Tk, щоб вікно не зависало"""
+        if index < len(chunks):
+            self.alternatives_text.insert(tk.END, chunks[index])
+            self._pending_chunks = self.after_idle(self._insert_chunks, chunks, index + 1)
+        else:
+            self._pending_chunks = None
+
+    def _cancel_chunks(self):
+        """Скасовує відкладену вставку блоків CSV, якщо вона ще триває"""
+        if self._pending_chunks is not None:
+            self.after_cancel(self._pending_chunks)
+            self._pending_chunks = None
+
     def _load_example(self):
         """Завантаження прикладу"""
+        self._cancel_chunks()
         example = "Проект_A\nПроект_B\nПроект_C\nПроект_D"
-        self.alternatives_text.delete(1.0, tk.END)
-        self.alternatives_text.insert(1.0, example)
+        _text_replace(self.alternatives_text, example)
 
         # Додати приклад експертів
-        self.experts_list = [
-            ("Експерт_1", 0.85),
-            ("Експерт_2", 0.60)
-        ]
+        self._expert_ids = ["Експерт_1", "Експерт_2"]
+        self._expert_comps = array('d', (0.85, 0.60))
         self._update_experts_listbox()
 
     def _add_expert(self):
@@ -197,7 +298,10 @@ class ProjectSetupWindow(tk.Frame):
             messagebox.showerror("Помилка", "Компетентність має бути числом від 0 до 1")
             return
 
-        self.experts_list.append((expert_id, competence))
+        self._expert_ids.append(expert_id)
+        self._expert_comps.append(competence)
+        # Прокручуємо до кінця, щоб доданий експерт був видимий
+        self._experts_offset = len(self._expert_ids)
         self._update_experts_listbox()
 
         # Очистити поля
@@ -207,48 +311,107 @@ class ProjectSetupWindow(tk.Frame):
 
     def _remove_expert(self):
         """Видалити експерта"""
-        selection = self.experts_listbox.curselection()
+        selection = self.experts_view.selection()
         if selection:
-            idx = selection[0]
-            self.experts_list.pop(idx)
+            # Ідентифікатор рядка - індекс експерта у масивах
+            idx = int(selection[0])
+            del self._expert_ids[idx]
+            del self._expert_comps[idx]
             self._update_experts_listbox()
 
+    @property
+    def experts_list(self) -> List[Tuple[str, float]]:
+        """Список експертів у вигляді пар (ID, компетентність)"""
+        return list(zip(self._expert_ids, self._expert_comps))
+
     def _update_experts_listbox(self):
-        """Оновити список експертів"""
-        self.experts_listbox.delete(0, tk.END)
-        for expert_id, competence in self.experts_list:
-            self.experts_listbox.insert(tk.END, f"{expert_id} (компетентність: {competence:.2f})")
+        """Оновити видиму частину списку експертів"""
+        total = len(self._expert_ids)
+        rows = self._experts_rows
+        start = max(0, min(self._experts_offset, total - rows))
+        stop = min(total, start + rows)
+        self._experts_offset = start
+
+        view = self.experts_view
+        view.delete(*view.get_children())
+        for idx in range(start, stop):
+            view.insert(
+                '', tk.END, iid=str(idx),
+                text=f"{self._expert_ids[idx]} (компетентність: {self._expert_comps[idx]:.2f})"
+            )
 
-    def _on_start(self):
-        """Обробник кнопки початку"""
-        # Отримати альтернативи
+        if total:
+            self.experts_scrollbar.set(start / total, stop / total)
+        else:
+            self.experts_scrollbar.set(0.0, 1.0)
+
+    def _scroll_experts(self, delta: int):
+        """Зсуває вікно перегляду списку експертів на delta рядків"""
+        self._experts_offset += delta
+        self._update_experts_listbox()
+
+    def _on_experts_scroll(self, action, amount, unit=None):
+        """Обробник смуги прокрутки списку експертів"""
+        if action == 'moveto':
+            self._experts_offset = int(float(amount) * len(self._expert_ids))
+            self._update_experts_listbox()
+        elif unit == 'pages':
+            self._scroll_experts(int(amount) * self._experts_rows)
+        else:
+            self._scroll_experts(int(amount))
+
+    def _on_experts_wheel(self, event):
+        """Прокрутка списку експертів коліщатком миші"""
+        self._scroll_experts(-1 if event.delta > 0 else 1)
+        return "break"
+
+    def _on_experts_resize(self, event):
+        """Перераховує кількість видимих рядків після зміни розміру списку"""
+        row_height = int(ttk.Style(self).lookup('Treeview', 'rowheight') or 20)
+        rows = max(1, event.height // row_height)
+        if rows != self._experts_rows:
+            self._experts_rows = rows
+            self._update_experts_listbox()
+
+    def _parse_alternatives(self) -> List[str]:
+        """Непорожні рядки поля альтернатив без пробілів по краях"""
         alternatives_text = self.alternatives_text.get(1.0, tk.END)
-        alternatives = [line.strip() for line in alternatives_text.split('\n') if line.strip()]
+        return list(filter(None, map(str.strip, alternatives_text.splitlines())))
 
-        if len(alternatives) < 2:
-            messagebox.showerror("Помилка", "Потрібно принаймні 2 альтернативи")
-            return
+    def _on_alt_modified(self, event=None):
+        """Скидає кеш альтернатив після зміни тексту"""
+        self._alt_cache = None
+        # Скидання прапорця потрібне, щоб наступна зміна знову згенерувала подію
+        self.alternatives_text.edit_modified(False)
 
-        if len(self.experts_list) < 1:
-            messagebox.showerror("Помилка", "Потрібно принаймні 1 експерт")
-            return
+    def _get_alternatives(self) -> List[str]:
+        """Альтернативи з кешу або, якщо текст змінювався, розібрані заново"""
+        if self._alt_cache is None:
+            self._alt_cache = self._parse_alternatives()
+        return self._alt_cache
 
-        # Повернути дані
-        expert_ids = [expert_id for expert_id, _ in self.experts_list]
-        competence_coefficients = {expert_id: comp for expert_id, comp in self.experts_list}
+    def _on_start(self):
+        """Обробник кнопки початку"""
+        data = self.get_data()
+
+        if data is None:
+            if len(self._get_alternatives()) < 2:
+                messagebox.showerror("Помилка", "Потрібно принаймні 2 альтернативи")
+            else:
+                messagebox.showerror("Помилка", "Потрібно принаймні 1 експерт")
+            return
 
-        self.on_start_comparison(alternatives, expert_ids, competence_coefficients)
+        self.on_start_comparison(*data)
 
     def get_data(self) -> Optional[Tuple[List[str], List[str], Dict[str, float]]]:
         """Отримати дані проекту"""
-        alternatives_text = self.alternatives_text.get(1.0, tk.END)
-        alternatives = [line.strip() for line in alternatives_text.split('\n') if line.strip()]
+        alternatives = list(self._get_alternatives())
 
-        if len(alternatives) < 2 or len(self.experts_list) < 1:
+        if len(alternatives) < 2 or not self._expert_ids:
             return None
 
-        expert_ids = [expert_id for expert_id, _ in self.experts_list]
-        competence_coefficients = {expert_id: comp for expert_id, comp in self.experts_list}
+        expert_ids = list(self._expert_ids)
+        competence_coefficients = dict(zip(self._expert_ids, self._expert_comps))
 
         return alternatives, expert_ids, competence_coefficients
 
@@ -270,9 +433,28 @@ class ComparisonWindow(tk.Frame):
         self.current_expert: str = ""
         self.current_scale: ScaleType = ScaleType.SAATY_9
         self.current_gradations: int = 9
+        # Ідентифікатор відкладеного (after) оновлення інформації про градацію
+        self._pending_update: Optional[str] = None
+        self._key_bindings: List[Tuple[str, str]] = []
+
+        # Тексти міток градації прив'язані до змінних Tk: оновлення - запис
+        # змінної, а перемальовування відбувається в idle-циклі
+        self._grad_var = tk.StringVar(self, value="Рівноцінні")
+        self._val_var = tk.StringVar(self, value="Значення: 5")
+        self._info_var = tk.StringVar(self, value="Інформативність: 3.17 біт")
 
         self._setup_ui()
 
+    def destroy(self):
+        """Скасовує відкладене оновлення та знімає прив'язки клавіш перед знищенням вікна"""
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+            self._pending_update = None
+        for sequence, funcid in self._key_bindings:
+            _unbind_handler(self.master, sequence, funcid)
+        self._key_bindings = []
+        super().destroy()
+
     def _setup_ui(self):
         """Налаштування інтерфейсу"""
         # Шапка з інформацією
@@ -328,9 +510,7 @@ class ComparisonWindow(tk.Frame):
         )
 
         # Заповнюємо доступні шкали
-        scales = ScaleManager.get_available_scales()
-        scale_options = [f"{desc}" for scale_type, desc in scales]
-        self.scale_combo['values'] = scale_options
+        self.scale_combo['values'] = _SCALE_OPTIONS
         self.scale_combo.current(2)  # Сааті-9 за замовчуванням
         self.scale_combo.bind('<<ComboboxSelected>>', self._on_scale_change)
         self.scale_combo.pack(side=tk.LEFT, padx=5)
@@ -342,7 +522,7 @@ class ComparisonWindow(tk.Frame):
         # Мітка градації
         self.gradation_label = tk.Label(
             slider_frame,
-            text="Рівноцінні",
+            textvariable=self._grad_var,
             font=("Arial", 14, "bold")
         )
         self.gradation_label.pack(pady=10)
@@ -361,7 +541,7 @@ class ComparisonWindow(tk.Frame):
         # Числове значення
         self.value_label = tk.Label(
             slider_frame,
-            text="Значення: 5",
+            textvariable=self._val_var,
             font=("Arial", 12)
         )
         self.value_label.pack(pady=5)
@@ -369,7 +549,7 @@ class ComparisonWindow(tk.Frame):
         # Підказка інформативності
         self.info_label = tk.Label(
             slider_frame,
-            text="Інформативність: 3.17 біт",
+            textvariable=self._info_var,
             font=("Arial", 10),
             fg="gray"
         )
@@ -408,31 +588,40 @@ class ComparisonWindow(tk.Frame):
             width=15
         ).pack(side=tk.LEFT, padx=10)
 
-        # Bind клавіші
-        self.master.bind('<Left>', lambda e: self._adjust_slider(-1))
-        self.master.bind('<Right>', lambda e: self._adjust_slider(1))
-        self.master.bind('<Return>', lambda e: self._on_confirm())
+        # Bind клавіші; ідентифікатори зберігаються, щоб зняти прив'язки з
+        # батьківського вікна разом із цим вікном
+        self._key_bindings = [
+            (sequence, self.master.bind(sequence, handler, add='+'))
+            for sequence, handler in (
+                ('<Left>', lambda e: self._adjust_slider(-1)),
+                ('<Right>', lambda e: self._adjust_slider(1)),
+                ('<Return>', lambda e: self._on_confirm()),
+            )
+        ]
 
         self._update_scale_info()
 
     def _on_scale_change(self, event=None):
         """Обробник зміни шкали"""
-        scale_text = self.scale_var.get()
-
-        # Визначаємо тип шкали
-        scales = ScaleManager.get_available_scales()
-        for scale_type, desc in scales:
-            if desc in scale_text:
-                self.current_scale = scale_type
-                min_grad, max_grad = ScaleManager.get_scale_gradations_range(scale_type)
-                self.current_gradations = max_grad
-                break
+        # Тип шкали визначається за індексом вибраного пункту списку
+        idx = self.scale_combo.current()
+        if idx >= 0:
+            scale_type = _SCALES[idx][0]
+            self.current_scale = scale_type
+            min_grad, max_grad = ScaleManager.get_scale_gradations_range(scale_type)
+            self.current_gradations = max_grad
 
         self._update_scale_info()
 
     def _on_slider_change(self, value):
-        """Обробник зміни слайдера"""
-        self._update_scale_info()
+        """
+        Обробник зміни слайдера. Під час перетягування подія приходить на
+        кожен піксель, тому оновлення відкладається на 30 мс і серія подій
+        зводиться до одного оновлення
+        """
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(_SLIDER_DEBOUNCE_MS, self._update_scale_info)
 
     def _adjust_slider(self, delta: int):
         """Зміна значення слайдера клавішами"""
@@ -443,7 +632,10 @@ class ComparisonWindow(tk.Frame):
 
     def _update_scale_info(self):
         """Оновлює інформацію про поточну градацію"""
-        from scales import get_scale_values, calculate_informativeness
+        if self._pending_update is not None:
+            # Пряме оновлення робить відкладене зайвим
+            self.after_cancel(self._pending_update)
+            self._pending_update = None
 
         # Отримуємо поточний індекс
         grade_index = int(self.slider.get())
@@ -464,15 +656,15 @@ class ComparisonWindow(tk.Frame):
             self.current_gradations,
             grade_index
         )
-        self.gradation_label.config(text=label)
+        self._grad_var.set(label)
 
         # Числове значення
-        self.value_label.config(text=f"Значення: {value:.2f}")
+        self._val_var.set(f"Значення: {value:.2f}")
 
         # Інформативність
         informativeness = calculate_informativeness(self.current_gradations)
-        self.info_label.config(
-            text=f"Інформативність шкали: {informativeness:.2f} біт ({self.current_gradations} градацій)"
+        self._info_var.set(
+            f"Інформативність шкали: {informativeness:.2f} біт ({self.current_gradations} градацій)"
         )
 
     def _on_refine(self):
@@ -501,8 +693,6 @@ class ComparisonWindow(tk.Frame):
 
     def _on_confirm(self):
         """Підтвердження оцінки"""
-        from scales import get_scale_values
-
         grade_index = int(self.slider.get())
         values = get_scale_values(self.current_scale, self.current_gradations)
 
@@ -537,6 +727,9 @@ class ResultsWindow(tk.Frame):
         self.on_save_session = on_save_session
         self.on_new = on_new
 
+        # Останні результати: вкладки, створені пізніше, заповнюються з них
+        self._results: Optional[Dict] = None
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -558,15 +751,26 @@ class ResultsWindow(tk.Frame):
         self.notebook.add(weights_frame, text="Ваги та ранжування")
         self._setup_weights_tab(weights_frame)
 
+        # Вкладки узгодженості та рекомендацій спершу порожні: їхні віджети
+        # створюються при першому відкритті вкладки
+        self.consistency_text = None
+        self.suggestions_text = None
+
         # Вкладка: Узгодженість
         consistency_frame = tk.Frame(self.notebook)
         self.notebook.add(consistency_frame, text="Узгодженість")
-        self._setup_consistency_tab(consistency_frame)
 
         # Вкладка: Рекомендації
         suggestions_frame = tk.Frame(self.notebook)
         self.notebook.add(suggestions_frame, text="Рекомендації")
-        self._setup_suggestions_tab(suggestions_frame)
+
+        self._lazy_tabs = {
+            str(consistency_frame): (consistency_frame, self._setup_consistency_tab,
+                                     self._render_consistency),
+            str(suggestions_frame): (suggestions_frame, self._setup_suggestions_tab,
+                                     self._render_suggestions),
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # Кнопки експорту
         export_frame = tk.Frame(self)
@@ -627,6 +831,10 @@ class ResultsWindow(tk.Frame):
         )
         self.consistency_text.pack(fill=tk.BOTH, expand=True)
 
+        # Теги індикатора узгодженості оголошуються один раз
+        self.consistency_text.tag_config("good", foreground="green", font=("Courier", 10, "bold"))
+        self.consistency_text.tag_config("bad", foreground="red", font=("Courier", 10, "bold"))
+
     def _setup_suggestions_tab(self, parent):
         """Налаштування вкладки рекомендацій"""
         self.suggestions_text = scrolledtext.ScrolledText(
@@ -636,22 +844,58 @@ class ResultsWindow(tk.Frame):
         )
         self.suggestions_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+    def _on_tab_changed(self, event=None):
+        """Створює вміст вкладки при першому відкритті та заповнює його результатами"""
+        tab = self._lazy_tabs.pop(self.notebook.select(), None)
+        if tab is None:
+            return
+
+        frame, setup, render = tab
+        setup(frame)
+        if self._results is not None:
+            render(self._results)
+
     def display_results(self, results: Dict):
         """Відображає результати"""
-        # Ваги та ранжування
-        self.weights_tree.delete(*self.weights_tree.get_children())
-        for item in results['ranking']:
-            self.weights_tree.insert('', tk.END, values=(
-                item['rank'],
-                item['alternative'],
-                f"{item['weight']:.4f}"
-            ))
-
-        # Узгодженість
-        consistency = results['consistency']
-        self.consistency_text.delete(1.0, tk.END)
+        self._results = results
+        self._render_weights(results)
+        if self.consistency_text is not None:
+            self._render_consistency(results)
+        if self.suggestions_text is not None:
+            self._render_suggestions(results)
+
+    def _render_weights(self, results: Dict):
+        """Заповнює таблицю ваг та ранжування"""
+        # Ваги та ранжування: рядки готуються заздалегідь, а таблиця на час
+        # масового оновлення знімається з компонування - один перерахунок замість N
+        rows = tuple(
+            (rank, alternative, format(weight, '.4f'))
+            for rank, alternative, weight in map(_RANKING_FIELDS, results['ranking'])
+        )
+        tree = self.weights_tree
+        pack_info = tree.pack_info()
+        pack_info.pop('in', None)
+        siblings = tree.master.pack_slaves()
+        following = siblings[siblings.index(tree) + 1:]
+        tree.pack_forget()
+
+        tree.delete(*tree.get_children())
+        if rows:
+            # Усі рядки вставляються одним викликом Tcl: кортеж рядків
+            # передається як список Tcl (з коректним екрануванням назв), а
+            # цикл foreach виконується всередині інтерпретатора
+            tree.tk.call('foreach', 'row', rows,
+                         f'{tree} insert {{}} end -values $row')
+
+        if following:
+            tree.pack(**pack_info, before=following[0])
+        else:
+            tree.pack(**pack_info)
 
-        text = f"""
+    def _render_consistency(self, results: Dict):
+        """Заповнює вкладку узгодженості"""
+        consistency = results['consistency']
+        parts = [f"""
 ПОКАЗНИКИ УЗГОДЖЕНОСТІ
 
 Максимальне власне значення (λ_max): {consistency['lambda_max']:.4f}
@@ -662,41 +906,44 @@ class ResultsWindow(tk.Frame):
 Поріг узгодженості:                    {consistency['threshold']:.2f}
 Результат:                             {'✓ УЗГОДЖЕНА' if consistency['is_consistent'] else '✗ НЕУЗГОДЖЕНА'}
 
-"""
+"""]
         if consistency['is_consistent']:
-            text += "\nМатриця попарних порівнянь є достатньо узгодженою.\n"
-            text += "Результати можна використовувати для прийняття рішень.\n"
+            parts.append("\nМатриця попарних порівнянь є достатньо узгодженою.\n")
+            parts.append("Результати можна використовувати для прийняття рішень.\n")
         else:
-            text += "\nМатриця має високу неузгодженість!\n"
-            text += "Рекомендується переглянути оцінки (дивіться вкладку 'Рекомендації').\n"
+            parts.append("\nМатриця має високу неузгодженість!\n")
+            parts.append("Рекомендується переглянути оцінки (дивіться вкладку 'Рекомендації').\n")
 
-        self.consistency_text.insert(1.0, text)
+        _text_replace(self.consistency_text, ''.join(parts))
 
-        # Колір індикатора
+        # Колір індикатора (теги оголошені під час створення вкладки)
         if consistency['is_consistent']:
             self.consistency_text.tag_add("good", "7.0", "7.end")
-            self.consistency_text.tag_config("good", foreground="green", font=("Courier", 10, "bold"))
         else:
             self.consistency_text.tag_add("bad", "7.0", "7.end")
-            self.consistency_text.tag_config("bad", foreground="red", font=("Courier", 10, "bold"))
 
-        # Рекомендації
-        self.suggestions_text.delete(1.0, tk.END)
+    def _render_suggestions(self, results: Dict):
+        """Заповнює вкладку рекомендацій"""
         suggestions = results['suggestions']
 
         if not suggestions:
-            self.suggestions_text.insert(
-                1.0,
+            _text_replace(
+                self.suggestions_text,
                 "Рекомендацій немає.\nМатриця попарних порівнянь є узгодженою."
             )
         else:
-            text = "РЕКОМЕНДАЦІЇ ДЛЯ ПОКРАЩЕННЯ УЗГОДЖЕНОСТІ\n\n"
-            text += f"Знайдено {len(suggestions)} порівнянь з найбільшими відхиленнями:\n\n"
+            # Фрагменти збираються у список і з'єднуються один раз - O(n) замість O(n²)
+            parts = [
+                "РЕКОМЕНДАЦІЇ ДЛЯ ПОКРАЩЕННЯ УЗГОДЖЕНОСТІ\n\n",
+                f"Знайдено {len(suggestions)} порівнянь з найбільшими відхиленнями:\n\n",
+            ]
 
             for i, sugg in enumerate(suggestions, 1):
-                text += f"{i}. {sugg['comparison']}\n"
-                text += f"   Поточне значення:     {sugg['current_value']:.2f}\n"
-                text += f"   Рекомендоване значення: {sugg['suggested_value']:.2f}\n"
-                text += f"   Відхилення:           {sugg['deviation_percent']:.1f}%\n\n"
-
-            self.suggestions_text.insert(1.0, text)
+                parts.append(
+                    f"{i}. {sugg['comparison']}\n"
+                    f"   Поточне значення:     {sugg['current_value']:.2f}\n"
+                    f"   Рекомендоване значення: {sugg['suggested_value']:.2f}\n"
+                    f"   Відхилення:           {sugg['deviation_percent']:.1f}%\n\n"
+                )
+
+            _text_replace(self.suggestions_text, ''.join(parts))
@@ -0,0 +1,89 @@
+"""
+Модуль jsonio.py - спільний запис JSON для CLI (main.py) та GUI (gui/models.py)
+
+Реалізує:
+- Серіалізацію типів, які JSON не підтримує напряму (Enum, NumPy, dataclass)
+- Запис JSON файлу (UTF-8, відступ 2) через orjson, якщо він встановлений,
+  інакше через stdlib json
+- Потоковий запис JSON-масиву без побудови повного списку в пам'яті
+"""
+
+import dataclasses
+import json
+from enum import Enum
+from typing import Any, Iterable
+import numpy as np
+
+# Опціонально використовуємо orjson (швидша серіалізація), інакше stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Серіалізація типів, які JSON не підтримує напряму (параметр default
+    для json, orjson та msgpack)
+
+    Raises:
+        TypeError: Якщо тип не підтримується
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    # Власне подання (напр. Judgment.to_dict) має пріоритет над asdict
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode_json(data: Any) -> bytes:
+    """Кодує об'єкт у JSON (UTF-8, відступ 2) тим самим бекендом, що й dump_json"""
+    if orjson is not None:
+        return orjson.dumps(data, default=json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(data, ensure_ascii=False, indent=2, default=json_default).encode('utf-8')
+
+
+def dump_json(data: Any, filename: str) -> None:
+    """
+    Записує дані у JSON файл (UTF-8, відступ 2).
+    Масиви NumPy серіалізуються напряму, без попереднього .tolist()
+
+    Args:
+        data: Дані для серіалізації
+        filename: Шлях до файлу
+    """
+    # Кодуємо до відкриття файлу: при помилці серіалізації файл не створюється
+    encoded = encode_json(data)
+    with open(filename, 'wb') as f:
+        f.write(encoded)
+
+
+def dump_json_array(items: Iterable[Any], filename: str) -> None:
+    """
+    Потоково записує JSON-масив: елементи кодуються по одному, тож повний
+    список у пам'яті не потрібен. Результат збігається з dump_json(list(items))
+
+    Args:
+        items: Ітерабельне (зокрема генератор) елементів масиву
+        filename: Шлях до файлу
+    """
+    with open(filename, 'wb', buffering=1 << 16) as f:
+        first = True
+        for item in items:
+            f.write(b'[\n  ' if first else b',\n  ')
+            # Вкладаємо елемент на один рівень відступу; переведення рядків
+            # усередині JSON-рядків екрануються, тому \n тут лише структурні
+            f.write(encode_json(item).replace(b'\n', b'\n  '))
+            first = False
+        f.write(b'[]' if first else b'\n]')
@@ -16,25 +16,34 @@ main.py - Головний модуль для методу експертних
 """
 
 import argparse
+import csv
 import json
 import os
 import sys
 from pathlib import Path
 from typing import Dict, List
 import numpy as np
-import pandas as pd
+
+# Опціонально: pyarrow для журналу трансформацій у форматі Parquet
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
 from scales import ScaleType, calculate_informativeness, unify_to_cardinal
-from pcm import PairwiseComparisonMatrix
+from pcm import PairwiseComparisonMatrix, SCALE_TYPE_BY_CODE
 from consistency import (
     consistency_spectral,
-    calculate_weights_eigenvector,
+    consistency_and_weights,
     calculate_weights_geometric_mean,
     ideal_pcm,
     generate_revision_suggestions,
     rank_weights,
 )
 from aggregate import group_aggregate, aggregate_with_statistics, calculate_expert_weights
+from jsonio import dump_json
 
 
 def load_input_data(input_file: str) -> Dict:
@@ -74,42 +83,68 @@ def create_output_directory(output_dir: str) -> None:
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
 
-def log_scale_transformations(pcm_list: List[PairwiseComparisonMatrix], output_dir: str) -> None:
+# Назви шкал за цілочисельними кодами SoA-масивів МПП
+_SCALE_NAMES = tuple(scale_type.value for scale_type in SCALE_TYPE_BY_CODE)
+
+# Колонки журналу трансформацій шкал (порядок полів запису в JSON)
+_LOG_COLUMNS = (
+    'expert_id', 'comparison', 'alt_i', 'alt_j', 'original_scale',
+    'n_gradations', 'original_value', 'unified_value', 'informativeness',
+)
+
+
+def log_scale_transformations(pcm_list: List[PairwiseComparisonMatrix], output_dir: str,
+                              log_format: str = 'json') -> None:
     """
     Записує журнал трансформацій шкал у файл
 
     Args:
         pcm_list: Список МПП від експертів
         output_dir: Директорія для збереження
+        log_format: 'json' (scale_transformations.json, запис на оцінку) або
+                    'parquet' (scale_transformations.parquet, колонки; потребує pyarrow)
     """
-    log_entries = []
+    # Журнал збирається по колонках: для Parquet вони записуються напряму,
+    # для JSON складаються в записи лише на етапі серіалізації
+    columns: Dict[str, list] = {name: [] for name in _LOG_COLUMNS}
+    # Інформативність рахується один раз на кожну кількість градацій у всьому журналі
+    informativeness: Dict[int, float] = {}
 
     for pcm in pcm_list:
-        for (i, j), (scale_type, n_gradations, original_value) in pcm.original_judgments.items():
-            # Пропускаємо обернені оцінки (нижня трикутна частина)
-            if i > j:
-                continue
-
-            unified_value = pcm.unified_matrix[i, j]
-            informativeness = calculate_informativeness(n_gradations)
-
-            entry = {
-                'expert_id': pcm.expert_id,
-                'comparison': f"{pcm.alternatives[i]} vs {pcm.alternatives[j]}",
-                'alt_i': pcm.alternatives[i],
-                'alt_j': pcm.alternatives[j],
-                'original_scale': scale_type.value,
-                'n_gradations': n_gradations,
-                'original_value': float(original_value),
-                'unified_value': float(unified_value),
-                'informativeness': float(informativeness),
-            }
-            log_entries.append(entry)
-
-    # Зберігаємо як JSON
-    log_file = os.path.join(output_dir, 'scale_transformations.json')
-    with open(log_file, 'w', encoding='utf-8') as f:
-        json.dump(log_entries, f, ensure_ascii=False, indent=2)
+        # SoA-масиви вихідних оцінок ідуть у порядку ключів original_judgments
+        judgment_ij = pcm.judgment_ij
+        # Пропускаємо обернені оцінки (нижня трикутна частина)
+        upper = judgment_ij[:, 0] <= judgment_ij[:, 1]
+        i, j = judgment_ij[upper, 0], judgment_ij[upper, 1]
+        n_gradations = pcm.judgment_gradations[upper].tolist()
+        for n in set(n_gradations).difference(informativeness):
+            informativeness[n] = calculate_informativeness(n)
+
+        names = pcm.alternatives
+        alt_i = [names[k] for k in i.tolist()]
+        alt_j = [names[k] for k in j.tolist()]
+
+        columns['expert_id'].extend([pcm.expert_id] * len(alt_i))
+        columns['comparison'].extend(f"{a} vs {b}" for a, b in zip(alt_i, alt_j))
+        columns['alt_i'].extend(alt_i)
+        columns['alt_j'].extend(alt_j)
+        columns['original_scale'].extend(
+            _SCALE_NAMES[code] for code in pcm.judgment_scale_codes[upper].tolist()
+        )
+        columns['n_gradations'].extend(n_gradations)
+        columns['original_value'].extend(pcm.judgment_values[upper].tolist())
+        columns['unified_value'].extend(pcm.unified_matrix[i, j].tolist())
+        columns['informativeness'].extend(informativeness[n] for n in n_gradations)
+
+    if log_format == 'parquet':
+        if pa is None:
+            raise ImportError("Формат parquet потребує пакета pyarrow")
+        log_file = os.path.join(output_dir, 'scale_transformations.parquet')
+        pq.write_table(pa.table(columns), log_file)
+    else:
+        # Зберігаємо як JSON
+        log_file = os.path.join(output_dir, 'scale_transformations.json')
+        dump_json([dict(zip(_LOG_COLUMNS, row)) for row in zip(*columns.values())], log_file)
 
     print(f"Журнал трансформацій шкал збережено: {log_file}")
 
@@ -126,12 +161,14 @@ def save_weights(weights: np.ndarray, alternatives: List[str], output_dir: str)
     # Створюємо ранжування
     ranking = rank_weights(weights, alternatives)
 
-    # Конвертуємо у DataFrame
-    df = pd.DataFrame(ranking)
-
-    # Зберігаємо у CSV
+    # Зберігаємо у CSV напряму через csv (той самий формат, що давав
+    # pandas.DataFrame.to_csv: колонки в порядку ключів, рядки через os.linesep)
     csv_file = os.path.join(output_dir, 'weights.csv')
-    df.to_csv(csv_file, index=False, encoding='utf-8')
+    fieldnames = list(ranking[0]) if ranking else []
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(ranking)
 
     print(f"Вагові коефіцієнти збережено: {csv_file}")
 
@@ -151,12 +188,11 @@ def save_consistency_report(consistency_results: Dict, matrix: np.ndarray,
         'consistency_analysis': consistency_results,
         'matrix_size': len(alternatives),
         'alternatives': alternatives,
-        'aggregated_matrix': matrix.tolist(),
+        'aggregated_matrix': matrix,
     }
 
     json_file = os.path.join(output_dir, 'consistency.json')
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    dump_json(report, json_file)
 
     print(f"Звіт про узгодженість збережено: {json_file}")
 
@@ -170,38 +206,52 @@ def save_suggestions(suggestions: List[Dict], output_dir: str) -> None:
         output_dir: Директорія для збереження
     """
     json_file = os.path.join(output_dir, 'suggestions.json')
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(suggestions, f, ensure_ascii=False, indent=2)
+    dump_json(suggestions, json_file)
 
     print(f"Рекомендації збережено: {json_file}")
 
 
-def process_pairwise_comparisons(input_file: str, output_dir: str) -> None:
+def _write_lines(lines: List[str]) -> None:
+    """Виводить накопичені рядки звіту одним записом у stdout та очищує буфер"""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        lines.clear()
+
+
+def process_pairwise_comparisons(input_file: str, output_dir: str,
+                                 log_format: str = 'json') -> None:
     """
     Головна функція обробки попарних порівнянь
 
     Args:
         input_file: Шлях до вхідного JSON файлу
         output_dir: Директорія для збереження результатів
+        log_format: Формат журналу трансформацій шкал ('json' або 'parquet')
     """
-    print("=" * 80)
-    print("МЕТОД ЕКСПЕРТНИХ ПОПАРНИХ ПОРІВНЯНЬ З УТОЧНЕННЯМ СТУПЕНЯ ПЕРЕВАГИ")
-    print("=" * 80)
-    print()
+    # Рядки звіту накопичуються і виводяться одним записом на розділ
+    lines: List[str] = []
+    report = lines.append
+
+    report("=" * 80)
+    report("МЕТОД ЕКСПЕРТНИХ ПОПАРНИХ ПОРІВНЯНЬ З УТОЧНЕННЯМ СТУПЕНЯ ПЕРЕВАГИ")
+    report("=" * 80)
+    report('')
 
     # 1. Завантаження даних
-    print("1. Завантаження вхідних даних...")
+    report("1. Завантаження вхідних даних...")
+    _write_lines(lines)
     data = load_input_data(input_file)
     alternatives = data['alternatives']
     experts_data = data['experts']
     competence_coefficients = data.get('competence_coefficients', {})
 
-    print(f"   Альтернативи: {len(alternatives)}")
-    print(f"   Експерти: {len(experts_data)}")
-    print()
+    report(f"   Альтернативи: {len(alternatives)}")
+    report(f"   Експерти: {len(experts_data)}")
+    report('')
+    _write_lines(lines)
 
     # 2. Створення МПП для кожного експерта
-    print("2. Побудова матриць попарних порівнянь...")
+    report("2. Побудова матриць попарних порівнянь...")
     pcm_list = []
 
     for expert_data in experts_data:
@@ -213,95 +263,105 @@ def process_pairwise_comparisons(input_file: str, output_dir: str) -> None:
         # Заповнення неповних МПП через транзитивність
         if pcm.get_status().value == 'incomplete':
             filled_count = pcm.fill_transitive()
-            print(f"   {expert_id}: заповнено {filled_count} елементів транзитивно")
+            report(f"   {expert_id}: заповнено {filled_count} елементів транзитивно")
 
         pcm_list.append(pcm)
-        print(f"   {expert_id}: {len(judgments)} оцінок, статус: {pcm.get_status().value}")
+        report(f"   {expert_id}: {len(judgments)} оцінок, статус: {pcm.get_status().value}")
 
-    print()
+    report('')
+    _write_lines(lines)
 
     # 3. Оцінка узгодженості для кожного експерта
-    print("3. Оцінка узгодженості індивідуальних МПП...")
+    report("3. Оцінка узгодженості індивідуальних МПП...")
     for pcm in pcm_list:
         consistency = consistency_spectral(pcm.unified_matrix)
-        print(f"   {pcm.expert_id}:")
-        print(f"      λ_max = {consistency['lambda_max']:.4f}")
-        print(f"      CI = {consistency['CI']:.4f}")
-        print(f"      CR = {consistency['CR']:.4f}")
-        print(f"      Узгоджена: {'Так' if consistency['is_consistent'] else 'Ні'}")
+        report(f"   {pcm.expert_id}:")
+        report(f"      λ_max = {consistency['lambda_max']:.4f}")
+        report(f"      CI = {consistency['CI']:.4f}")
+        report(f"      CR = {consistency['CR']:.4f}")
+        report(f"      Узгоджена: {'Так' if consistency['is_consistent'] else 'Ні'}")
 
-    print()
+    report('')
+    _write_lines(lines)
 
     # 4. Агрегація групових оцінок
-    print("4. Агрегація групових експертних оцінок...")
+    report("4. Агрегація групових експертних оцінок...")
     aggregation_result = aggregate_with_statistics(pcm_list, competence_coefficients)
     aggregated_matrix = aggregation_result['aggregated_matrix']
 
-    print("   Ваги експертів:")
+    report("   Ваги експертів:")
     for stats in aggregation_result['expert_statistics']:
-        print(f"      {stats['expert_id']}: {stats['weight']:.4f} " +
+        report(f"      {stats['expert_id']}: {stats['weight']:.4f} " +
               f"(компетентність: {stats['competence']:.2f})")
 
-    print()
+    report('')
+    _write_lines(lines)
 
     # 5. Оцінка узгодженості агрегованої МПП
-    print("5. Оцінка узгодженості агрегованої МПП...")
-    group_consistency = consistency_spectral(aggregated_matrix)
-    print(f"   λ_max = {group_consistency['lambda_max']:.4f}")
-    print(f"   CI = {group_consistency['CI']:.4f}")
-    print(f"   CR = {group_consistency['CR']:.4f}")
-    print(f"   Узгоджена: {'Так' if group_consistency['is_consistent'] else 'Ні'}")
-    print()
+    report("5. Оцінка узгодженості агрегованої МПП...")
+    # Ваги методом власного вектора виходять з того ж розрахунку, що й λ_max
+    group_consistency = consistency_and_weights(aggregated_matrix)
+    weights_eigenvector = group_consistency.pop('weights')
+    report(f"   λ_max = {group_consistency['lambda_max']:.4f}")
+    report(f"   CI = {group_consistency['CI']:.4f}")
+    report(f"   CR = {group_consistency['CR']:.4f}")
+    report(f"   Узгоджена: {'Так' if group_consistency['is_consistent'] else 'Ні'}")
+    report('')
+    _write_lines(lines)
 
     # 6. Генерація рекомендацій (якщо неузгоджена)
     suggestions = []
     if not group_consistency['is_consistent']:
-        print("6. Генерація рекомендацій для покращення узгодженості...")
+        report("6. Генерація рекомендацій для покращення узгодженості...")
         suggestions = generate_revision_suggestions(aggregated_matrix, alternatives, top_k=5)
         for i, sugg in enumerate(suggestions, 1):
-            print(f"   {i}. {sugg['comparison']}: "
+            report(f"   {i}. {sugg['comparison']}: "
                   f"поточне {sugg['current_value']:.2f} → "
                   f"рекомендоване {sugg['suggested_value']:.2f} "
                   f"(відхилення {sugg['deviation_percent']:.1f}%)")
-        print()
+        report('')
+    _write_lines(lines)
 
     # 7. Розрахунок вагових коефіцієнтів
-    print("7. Розрахунок вагових коефіцієнтів...")
-    weights_eigenvector = calculate_weights_eigenvector(aggregated_matrix)
+    report("7. Розрахунок вагових коефіцієнтів...")
     weights_geometric = calculate_weights_geometric_mean(aggregated_matrix)
 
-    print("   Метод власного вектора:")
+    report("   Метод власного вектора:")
     for alt, w in zip(alternatives, weights_eigenvector):
-        print(f"      {alt}: {w:.4f}")
+        report(f"      {alt}: {w:.4f}")
 
-    print()
-    print("   Метод геометричного середнього:")
+    report('')
+    report("   Метод геометричного середнього:")
     for alt, w in zip(alternatives, weights_geometric):
-        print(f"      {alt}: {w:.4f}")
+        report(f"      {alt}: {w:.4f}")
 
-    print()
+    report('')
+    _write_lines(lines)
 
     # 8. Ранжування альтернатив
-    print("8. Ранжування альтернатив (метод власного вектора):")
+    report("8. Ранжування альтернатив (метод власного вектора):")
     ranking = rank_weights(weights_eigenvector, alternatives)
     for item in ranking:
-        print(f"   Ранг {item['rank']}: {item['alternative']} (вага: {item['weight']:.4f})")
+        report(f"   Ранг {item['rank']}: {item['alternative']} (вага: {item['weight']:.4f})")
 
-    print()
+    report('')
+    _write_lines(lines)
 
     # 9. Збереження результатів
-    print("9. Збереження результатів...")
+    report("9. Збереження результатів...")
+    _write_lines(lines)
     create_output_directory(output_dir)
 
     save_weights(weights_eigenvector, alternatives, output_dir)
     save_consistency_report(group_consistency, aggregated_matrix, alternatives, output_dir)
     save_suggestions(suggestions, output_dir)
-    log_scale_transformations(pcm_list, output_dir)
+    log_scale_transformations(pcm_list, output_dir, log_format)
 
-    print()
-    print("=" * 80)
-    print("ОБРОБКА ЗАВЕРШЕНА")
-    print("=" * 80)
+    report('')
+    report("=" * 80)
+    report("ОБРОБКА ЗАВЕРШЕНА")
+    report("=" * 80)
+    _write_lines(lines)
 
 
 def main():
@@ -323,11 +383,19 @@ def main():
         default='out',
         help='Директорія для збереження результатів (за замовчуванням: out/)'
     )
+    parser.add_argument(
+        '--log-format',
+        choices=('json', 'parquet'),
+        default='json',
+        help='Формат журналу трансформацій шкал (за замовчуванням: json; parquet потребує pyarrow)'
+    )
 
     args = parser.parse_args()
+    if args.log_format == 'parquet' and pa is None:
+        parser.error("формат parquet потребує пакета pyarrow")
 
     try:
-        process_pairwise_comparisons(args.input, args.out)
+        process_pairwise_comparisons(args.input, args.out, args.log_format)
     except Exception as e:
         print(f"\nПомилка під час обробки: {e}", file=sys.stderr)
         import traceback
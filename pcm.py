@@ -11,9 +11,88 @@
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Set
 from enum import Enum
-from scales import ScaleType, unify_judgment
+from scales import ScaleType, unify_judgment, unify_judgment_batch
+
+# Опціональне JIT-прискорення заповнення МПП (numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _fill_pcm_kernel(matrix, mask, idx_i, idx_j, values):
+        """
+        Записує оцінки та обернені до них (a_ji = 1/a_ij) за один прохід
+        """
+        for k in range(values.shape[0]):
+            i = idx_i[k]
+            j = idx_j[k]
+            matrix[i, j] = values[k]
+            mask[i, j] = True
+            if values[k] != 0:
+                matrix[j, i] = 1.0 / values[k]
+                mask[j, i] = True
+
+    @njit(cache=True, nogil=True)
+    def _fill_transitive_kernel(matrix, mask):
+        """
+        Транзитивне заповнення a_ij = a_ik * a_kj; той самий порядок обходу,
+        що й у PairwiseComparisonMatrix.fill_transitive
+        """
+        n = matrix.shape[0]
+        filled_count = 0
+        for _ in range(n * n):
+            made_progress = False
+            for i in range(n):
+                for j in range(n):
+                    if i == j or mask[i, j]:
+                        continue
+                    for k in range(n):
+                        if k == i or k == j:
+                            continue
+                        if mask[i, k] and mask[k, j]:
+                            value = max(1 / 9, min(9.0, matrix[i, k] * matrix[k, j]))
+                            matrix[i, j] = value
+                            matrix[j, i] = 1.0 / value
+                            mask[i, j] = True
+                            mask[j, i] = True
+                            filled_count += 1
+                            made_progress = True
+                            break
+            if not made_progress:
+                break
+        return filled_count
+
+
+# Типи шкал у порядку їхніх цілочисельних кодів у SoA-масивах оцінок
+SCALE_TYPE_BY_CODE: Tuple[ScaleType, ...] = tuple(ScaleType)
+_SCALE_TYPE_CODES: Dict[ScaleType, int] = {
+    scale_type: code for code, scale_type in enumerate(SCALE_TYPE_BY_CODE)
+}
+
+# Рядкове значення шкали -> ScaleType без виклику конструктора Enum на кожну оцінку
+_SCALE_LOOKUP: Dict[str, ScaleType] = {scale_type.value: scale_type for scale_type in ScaleType}
+
+
+@lru_cache(maxsize=16)
+def _matrix_templates(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Незмінні шаблони порожньої МПП розміру n: одинична матриця значень
+    та маска з заповненою діагоналлю. Експерти з однаковою кількістю
+    альтернатив копіюють готові шаблони замість створення та заповнення
+    """
+    ones = np.ones((n, n))
+    mask = np.zeros((n, n), dtype=bool)
+    np.fill_diagonal(mask, True)
+    ones.setflags(write=False)
+    mask.setflags(write=False)
+    return ones, mask
 
 
 class PCMStatus(Enum):
@@ -46,17 +125,35 @@ class PairwiseComparisonMatrix:
         self.n_alternatives = len(alternatives)
         self.expert_id = expert_id
 
+        # Відображення назва -> індекс альтернативи для пошуку за O(1)
+        self._idx: Dict[str, int] = {alt: k for k, alt in enumerate(alternatives)}
+
+        # Початкові матриця та маска копіюються зі спільних шаблонів розміру n
+        ones_template, mask_template = _matrix_templates(self.n_alternatives)
+
         # Уніфікована МПП (кардинальна шкала 1-9)
-        self.unified_matrix = np.ones((self.n_alternatives, self.n_alternatives))
+        self.unified_matrix = ones_template.copy()
 
         # Зберігання інформації про вихідні оцінки
         # Формат: (i, j) -> (scale_type, n_gradations, original_value)
         self.original_judgments: Dict[Tuple[int, int], Tuple[ScaleType, int, float]] = {}
 
-        # Маска заповнених елементів (True якщо оцінка надана)
-        self.filled_mask = np.zeros((self.n_alternatives, self.n_alternatives), dtype=bool)
-        # Діагональ завжди заповнена одиницями
-        np.fill_diagonal(self.filled_mask, True)
+        # Дзеркало original_judgments у вигляді паралельних масивів (SoA) для
+        # векторизованих обчислень: k-та оцінка -> (i, j), код шкали,
+        # n_gradations, value. Ємність — усі впорядковані пари (i, j), i != j
+        capacity = self.n_alternatives * (self.n_alternatives - 1)
+        self._judgment_ij = np.zeros((capacity, 2), dtype=np.int32)
+        self._judgment_scale_codes = np.zeros(capacity, dtype=np.int8)
+        self._judgment_gradations = np.zeros(capacity, dtype=np.int32)
+        self._judgment_values = np.zeros(capacity)
+        self._judgment_slots: Dict[Tuple[int, int], int] = {}
+
+        # Маска заповнених елементів (True якщо оцінка надана); діагональ
+        # завжди заповнена одиницями
+        self.filled_mask = mask_template.copy()
+
+        # Остання перевірка зв'язності: (вміст filled_mask, результат)
+        self._connectivity_cache: Optional[Tuple[bytes, bool]] = None
 
     def add_judgment(self, alt_i: str, alt_j: str, value: float,
                     scale_type: ScaleType, n_gradations: int) -> None:
@@ -78,10 +175,17 @@ class PairwiseComparisonMatrix:
             >>> pcm.unified_matrix[0, 1]
             5.0
         """
-        # Знаходимо індекси альтернатив
-        i = self.alternatives.index(alt_i)
-        j = self.alternatives.index(alt_j)
+        # Знаходимо індекси альтернатив (словник замість лінійного list.index)
+        try:
+            i, j = self._idx[alt_i], self._idx[alt_j]
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]!r} is not in list") from None
+
+        self._add_judgment_at(i, j, value, scale_type, n_gradations)
 
+    def _add_judgment_at(self, i: int, j: int, value: float,
+                         scale_type: ScaleType, n_gradations: int) -> None:
+        """add_judgment для вже знайдених індексів альтернатив i, j"""
         if i == j:
             raise ValueError("Неможливо порівняти альтернативу саму з собою")
 
@@ -93,14 +197,45 @@ class PairwiseComparisonMatrix:
         self.filled_mask[i, j] = True
 
         # Зберігаємо вихідну інформацію
-        self.original_judgments[(i, j)] = (scale_type, n_gradations, value)
+        self._store_original(i, j, scale_type, n_gradations, value)
 
         # Встановлюємо обернену оцінку (зворотна симетрія, РЗОД-2011-3.pdf)
         if unified_value != 0:
             self.unified_matrix[j, i] = 1.0 / unified_value
             self.filled_mask[j, i] = True
             # Зберігаємо інформацію про обернену оцінку
-            self.original_judgments[(j, i)] = (scale_type, n_gradations, 1.0 / value)
+            self._store_original(j, i, scale_type, n_gradations, 1.0 / value)
+
+    def _store_original(self, i: int, j: int, scale_type: ScaleType,
+                        n_gradations: int, value: float) -> None:
+        """Записує вихідну оцінку у словник та синхронізує SoA-масиви"""
+        self.original_judgments[(i, j)] = (scale_type, n_gradations, value)
+
+        k = self._judgment_slots.setdefault((i, j), len(self._judgment_slots))
+        self._judgment_ij[k] = (i, j)
+        self._judgment_scale_codes[k] = _SCALE_TYPE_CODES[scale_type]
+        self._judgment_gradations[k] = n_gradations
+        self._judgment_values[k] = value
+
+    @property
+    def judgment_ij(self) -> np.ndarray:
+        """Індекси (i, j) вихідних оцінок, масив форми (m, 2)"""
+        return self._judgment_ij[:len(self._judgment_slots)]
+
+    @property
+    def judgment_scale_codes(self) -> np.ndarray:
+        """Коди шкал вихідних оцінок (індекси в SCALE_TYPE_BY_CODE), масив форми (m,)"""
+        return self._judgment_scale_codes[:len(self._judgment_slots)]
+
+    @property
+    def judgment_gradations(self) -> np.ndarray:
+        """Кількість градацій шкали кожної вихідної оцінки, масив форми (m,)"""
+        return self._judgment_gradations[:len(self._judgment_slots)]
+
+    @property
+    def judgment_values(self) -> np.ndarray:
+        """Вихідні значення оцінок, масив форми (m,)"""
+        return self._judgment_values[:len(self._judgment_slots)]
 
     def get_status(self) -> PCMStatus:
         """
@@ -140,25 +275,36 @@ class PairwiseComparisonMatrix:
             >>> pcm.check_connectivity()
             True
         """
+        # Результат залежить лише від маски; маска - публічний атрибут, тому
+        # ключем кешу є її вміст, а не лічильник змін
+        fingerprint = self.filled_mask.tobytes()
+        if self._connectivity_cache is not None and self._connectivity_cache[0] == fingerprint:
+            return self._connectivity_cache[1]
+
+        connected = self._compute_connectivity()
+        self._connectivity_cache = (fingerprint, connected)
+        return connected
+
+    def _compute_connectivity(self) -> bool:
+        """Пошук у ширину з вершини 0 по графу заповнених елементів"""
         # Будуємо матриці суміжності (ігноруємо діагональ)
         adjacency = self.filled_mask.copy()
         np.fill_diagonal(adjacency, False)
 
-        # Використовуємо DFS для перевірки зв'язності
-        visited = set()
+        if self.n_alternatives == 0:
+            return True
 
-        def dfs(node: int):
-            visited.add(node)
-            for neighbor in range(self.n_alternatives):
-                if adjacency[node, neighbor] and neighbor not in visited:
-                    dfs(neighbor)
+        # Пошук у ширину на булевій матриці суміжності: за крок фронт
+        # розширюється на всіх сусідів одразу (без рекурсії та циклу по вершинах)
+        reached = np.zeros(self.n_alternatives, dtype=bool)
+        reached[0] = True
+        frontier = reached.copy()
+        while frontier.any():
+            frontier = adjacency[frontier].any(axis=0) & ~reached
+            reached |= frontier
 
-        # Запускаємо DFS з першої вершини
-        if self.n_alternatives > 0:
-            dfs(0)
-
-        # Граф зв'язний, якщо відвідали всі вершини
-        return len(visited) == self.n_alternatives
+        # Граф зв'язний, якщо досягнуто всі вершини
+        return bool(reached.all())
 
     def get_missing_comparisons(self) -> List[Tuple[str, str]]:
         """
@@ -172,12 +318,12 @@ class PairwiseComparisonMatrix:
             >>> len(pcm.get_missing_comparisons())
             3
         """
-        missing = []
-        for i in range(self.n_alternatives):
-            for j in range(i + 1, self.n_alternatives):
-                if not self.filled_mask[i, j]:
-                    missing.append((self.alternatives[i], self.alternatives[j]))
-        return missing
+        # Незаповнені елементи верхнього трикутника; np.nonzero повертає їх
+        # у тому ж порядку (рядок за рядком), що й вкладений цикл
+        rows, cols = np.nonzero(np.triu(~self.filled_mask, k=1))
+        names = self.alternatives
+        return list(zip(map(names.__getitem__, rows.tolist()),
+                        map(names.__getitem__, cols.tolist())))
 
     def fill_transitive(self) -> int:
         """
@@ -195,36 +341,43 @@ class PairwiseComparisonMatrix:
             >>> filled > 0
             True
         """
+        if NUMBA_AVAILABLE:
+            return int(_fill_transitive_kernel(self.unified_matrix, self.filled_mask))
+
+        matrix = self.unified_matrix
+        mask = self.filled_mask
         filled_count = 0
         max_iterations = self.n_alternatives ** 2  # Запобігання нескінченному циклу
+        # Буфер кандидатів k, спільний для всіх пар (i, j): без алокацій у циклі
+        candidates = np.empty(self.n_alternatives, dtype=bool)
 
         for iteration in range(max_iterations):
             made_progress = False
 
             for i in range(self.n_alternatives):
-                for j in range(self.n_alternatives):
-                    if i == j or self.filled_mask[i, j]:
+                # Відсутні елементи рядка i; заповнення інших елементів рядка
+                # під час обходу не змінює цей перелік
+                for j in np.flatnonzero(~mask[i]):
+                    # Проміжні вершини k: a_ij = a_ik * a_kj. Діагональ не
+                    # потрапляє в кандидати, бо mask[i, j] = False; береться
+                    # перший k - той самий, що й у послідовному пошуку
+                    np.logical_and(mask[i], mask[:, j], out=candidates)
+                    k = candidates.argmax()
+                    if not candidates[k]:
                         continue
 
-                    # Шукаємо проміжну вершину k: a_ij = a_ik * a_kj
-                    for k in range(self.n_alternatives):
-                        if k == i or k == j:
-                            continue
+                    # Обчислюємо транзитивне значення
+                    transitive_value = matrix[i, k] * matrix[k, j]
+                    # Обмежуємо діапазон [1/9, 9]
+                    transitive_value = max(1/9, min(9, transitive_value))
 
-                        if self.filled_mask[i, k] and self.filled_mask[k, j]:
-                            # Обчислюємо транзитивне значення
-                            transitive_value = self.unified_matrix[i, k] * self.unified_matrix[k, j]
-                            # Обмежуємо діапазон [1/9, 9]
-                            transitive_value = max(1/9, min(9, transitive_value))
+                    matrix[i, j] = transitive_value
+                    matrix[j, i] = 1.0 / transitive_value
+                    mask[i, j] = True
+                    mask[j, i] = True
 
-                            self.unified_matrix[i, j] = transitive_value
-                            self.unified_matrix[j, i] = 1.0 / transitive_value
-                            self.filled_mask[i, j] = True
-                            self.filled_mask[j, i] = True
-
-                            filled_count += 1
-                            made_progress = True
-                            break
+                    filled_count += 1
+                    made_progress = True
 
             if not made_progress:
                 break
@@ -244,12 +397,10 @@ class PairwiseComparisonMatrix:
             >>> len(pcm.get_filled_pairs())
             2
         """
-        pairs = []
-        for i in range(self.n_alternatives):
-            for j in range(self.n_alternatives):
-                if i != j and self.filled_mask[i, j]:
-                    pairs.append((i, j))
-        return pairs
+        off_diagonal = self.filled_mask.copy()
+        np.fill_diagonal(off_diagonal, False)
+        rows, cols = np.nonzero(off_diagonal)
+        return list(zip(rows.tolist(), cols.tolist()))
 
     def to_dict(self) -> dict:
         """
@@ -277,7 +428,8 @@ class PairwiseComparisonMatrix:
     @staticmethod
     def from_judgments(alternatives: List[str],
                       judgments: List[Dict],
-                      expert_id: str = "expert_1") -> 'PairwiseComparisonMatrix':
+                      expert_id: str = "expert_1",
+                      alt_index: Optional[Dict[str, int]] = None) -> 'PairwiseComparisonMatrix':
         """
         Створює МПП зі списку експертних оцінок
 
@@ -286,6 +438,8 @@ class PairwiseComparisonMatrix:
             judgments: Список словників з оцінками
                       [{alt_i, alt_j, value, scale_type, n_gradations}, ...]
             expert_id: Ідентифікатор експерта
+            alt_index: Готове відображення назва -> індекс альтернативи (напр.
+                      спільне для всіх експертів сесії); якщо не задано, будується тут
 
         Returns:
             Заповнена МПП
@@ -299,19 +453,127 @@ class PairwiseComparisonMatrix:
             >>> pcm.n_alternatives
             3
         """
+        if alt_index is None:
+            alt_index = {alt: k for k, alt in enumerate(alternatives)}
+
+        # Збираємо оцінки в паралельні масиви та будуємо МПП одним пакетом;
+        # пошук індексів - у словнику замість лінійного list.index на кожну оцінку
+        try:
+            idx_i = [alt_index[judgment['alt_i']] for judgment in judgments]
+            idx_j = [alt_index[judgment['alt_j']] for judgment in judgments]
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]!r} is not in list") from None
+
+        values = [judgment['value'] for judgment in judgments]
+        # Конвертуємо строки в ScaleType
+        try:
+            scale_types = [_SCALE_LOOKUP[judgment['scale_type']] for judgment in judgments]
+        except (KeyError, TypeError):
+            # Повідомлення про помилку - як у конструктора ScaleType
+            scale_types = [ScaleType(judgment['scale_type']) for judgment in judgments]
+        n_gradations = [judgment['n_gradations'] for judgment in judgments]
+
+        return PairwiseComparisonMatrix.from_arrays(
+            alternatives, idx_i, idx_j, values, scale_types, n_gradations, expert_id
+        )
+
+    @staticmethod
+    def from_arrays(alternatives: List[str],
+                    idx_i: np.ndarray,
+                    idx_j: np.ndarray,
+                    values: np.ndarray,
+                    scale_types: List[ScaleType],
+                    n_gradations: np.ndarray,
+                    expert_id: str = "expert_1") -> 'PairwiseComparisonMatrix':
+        """
+        Створює МПП з паралельних масивів оцінок, заповнюючи матрицю
+        векторизовано. Результат збігається з послідовними викликами
+        add_judgment: остання оцінка пари перекриває попередні.
+
+        Args:
+            alternatives: Список альтернатив
+            idx_i: Індекси альтернатив i (рядки)
+            idx_j: Індекси альтернатив j (стовпці)
+            values: Значення оцінок на вихідних шкалах
+            scale_types: Типи шкал оцінок
+            n_gradations: Кількості градацій шкал
+            expert_id: Ідентифікатор експерта
+
+        Returns:
+            Заповнена МПП
+
+        Examples:
+            >>> pcm = PairwiseComparisonMatrix.from_arrays(
+            ...     ['A1', 'A2', 'A3'], [0, 1], [1, 2], [3.0, 5.0],
+            ...     [ScaleType.SAATY_9, ScaleType.SAATY_9], [9, 9])
+            >>> pcm.get_status()
+            <PCMStatus.INCOMPLETE: 'incomplete'>
+        """
         pcm = PairwiseComparisonMatrix(alternatives, expert_id)
+        n = pcm.n_alternatives
 
-        for judgment in judgments:
-            alt_i = judgment['alt_i']
-            alt_j = judgment['alt_j']
-            value = judgment['value']
-            scale_type_str = judgment['scale_type']
-            n_gradations = judgment['n_gradations']
+        idx_i = np.asarray(idx_i, dtype=np.intp)
+        idx_j = np.asarray(idx_j, dtype=np.intp)
+        values = np.asarray(values, dtype=float)
+        n_gradations = np.asarray(n_gradations, dtype=np.int32)
 
-            # Конвертуємо строку в ScaleType
-            scale_type = ScaleType(scale_type_str)
+        if np.any(idx_i == idx_j):
+            raise ValueError("Неможливо порівняти альтернативу саму з собою")
 
-            pcm.add_judgment(alt_i, alt_j, value, scale_type, n_gradations)
+        # Залишаємо останню оцінку кожної (невпорядкованої) пари; пари
+        # впорядковуються за першою появою, як ключі при послідовних add_judgment
+        pair_keys = np.minimum(idx_i, idx_j) * n + np.maximum(idx_i, idx_j)
+        _, first = np.unique(pair_keys, return_index=True)
+        _, last_reversed = np.unique(pair_keys[::-1], return_index=True)
+        last = len(pair_keys) - 1 - last_reversed
+        by_appearance = np.argsort(first)
+        first, last = first[by_appearance], last[by_appearance]
+
+        first_i = idx_i[first]
+        idx_i, idx_j = idx_i[last], idx_j[last]
+        values, n_gradations = values[last], n_gradations[last]
+        scale_types = [scale_types[k] for k in last]
+
+        # Уніфікуємо оцінки до кардинальної шкали: один векторний виклик
+        # на кожну пару (шкала, кількість градацій)
+        unified = np.empty(len(values))
+        buckets: Dict[Tuple[ScaleType, int], List[int]] = {}
+        for k, key in enumerate(zip(scale_types, n_gradations.tolist())):
+            buckets.setdefault(key, []).append(k)
+        for (scale_type, n_grad), positions in buckets.items():
+            unified[positions] = unify_judgment_batch(scale_type, n_grad, values[positions])
+
+        # Заповнюємо матрицю та встановлюємо обернені оцінки (РЗОД-2011-3.pdf)
+        reciprocal = unified != 0
+        if NUMBA_AVAILABLE:
+            _fill_pcm_kernel(pcm.unified_matrix, pcm.filled_mask, idx_i, idx_j, unified)
+        else:
+            # Записи впорядковуються за лінійним індексом комірки, щоб scatter
+            # проходив матрицю послідовно, рядок за рядком
+            order = np.argsort(idx_i * n + idx_j, kind='stable')
+            rows, cols = idx_i[order], idx_j[order]
+            pcm.unified_matrix[rows, cols] = unified[order]
+            pcm.filled_mask[rows, cols] = True
+
+            mirror_i, mirror_j = idx_j[reciprocal], idx_i[reciprocal]
+            order = np.argsort(mirror_i * n + mirror_j, kind='stable')
+            rows, cols = mirror_i[order], mirror_j[order]
+            pcm.unified_matrix[rows, cols] = 1.0 / unified[reciprocal][order]
+            pcm.filled_mask[rows, cols] = True
+
+        # Зберігаємо вихідну інформацію; першим записується напрямок першої
+        # оцінки пари, щоб порядок ключів збігався з послідовним заповненням
+        for k, (a, i, j) in enumerate(zip(first_i.tolist(), idx_i.tolist(), idx_j.tolist())):
+            value = float(values[k])
+            scale_type, n_grad = scale_types[k], int(n_gradations[k])
+            if not reciprocal[k]:
+                pcm._store_original(i, j, scale_type, n_grad, value)
+            elif a == i:
+                pcm._store_original(i, j, scale_type, n_grad, value)
+                pcm._store_original(j, i, scale_type, n_grad, 1.0 / value)
+            else:
+                pcm._store_original(j, i, scale_type, n_grad, 1.0 / value)
+                pcm._store_original(i, j, scale_type, n_grad, value)
 
         return pcm
 
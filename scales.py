@@ -10,10 +10,37 @@
 """
 
 import math
+from bisect import bisect_left
 from enum import Enum
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Union
 import numpy as np
 
+# Опціональне JIT-прискорення пошуку найближчих градацій (numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _closest_grades_kernel(values, scale_values, out):
+        """
+        Індекси найближчих градацій для масиву оцінок за один прохід;
+        з рівновіддалених обирається перша, як і в unify_judgment
+        """
+        for k in range(values.shape[0]):
+            best = 0
+            best_distance = abs(scale_values[0] - values[k])
+            for g in range(1, scale_values.shape[0]):
+                distance = abs(scale_values[g] - values[k])
+                if distance < best_distance:
+                    best = g
+                    best_distance = distance
+            out[k] = best
+
 
 class ScaleType(Enum):
     """
@@ -40,97 +67,181 @@ SCALE_GRADATIONS_RANGE = {
 }
 
 
-def get_scale_values(scale_type: ScaleType, n_gradations: int) -> List[float]:
+def _ordinal_values(n_gradations: int) -> Tuple[float, ...]:
+    """Порядкова: екстремальні значення 1 та 9"""
+    return (1.0, 9.0)
+
+
+def _saaty_9_values(n_gradations: int) -> Tuple[float, ...]:
+    """
+    Фундаментальна шкала Сааті (РЗОД-2011-3.pdf): 1, 2, ..., 9 для n=9;
+    для менших n беремо перші n значень
+    """
+    return tuple(range(1, n_gradations + 1))
+
+
+def _saaty_5_values(n_gradations: int) -> Tuple[float, ...]:
+    """Сааті з 5 градаціями: 1, 3, 5, 7, 9 (РЗОД-2011-3.pdf)"""
+    if n_gradations == 5:
+        return (1.0, 3.0, 5.0, 7.0, 9.0)
+    elif n_gradations == 3:
+        return (1.0, 5.0, 9.0)
+    elif n_gradations == 4:
+        return (1.0, 3.0, 5.0, 9.0)
+    else:
+        # Для інших n інтерполюємо
+        return tuple(1.0 + (i * 8.0 / (n_gradations - 1)) for i in range(n_gradations))
+
+
+def _balanced_values(n_gradations: int) -> Tuple[float, ...]:
+    """
+    Збалансована шкала: w/(1-w), де w рівномірно розподілено (РЗОД-2011-3.pdf)
+    """
+    # Формула: для градації i від 1 до n, w_i = i/(n+1), значення = w/(1-w);
+    # w < 1 для всіх i, тож ділення на нуль неможливе
+    w = np.arange(1, n_gradations + 1, dtype=np.float64) / (n_gradations + 1)
+    values = w / (1 - w)
+    # Обмежуємо діапазон 1-9 на місці, без проміжного масиву
+    np.clip(values, 1.0, 9.0, out=values)
+    return tuple(values.tolist())
+
+
+def _power_values(n_gradations: int) -> Tuple[float, ...]:
+    """Степенева шкала: 9^((x-1)/(n-1)) (РЗОД-2011-3.pdf)"""
+    exponents = np.arange(n_gradations, dtype=np.float64) / (n_gradations - 1)
+    return tuple(np.power(9.0, exponents).tolist())
+
+
+def _ma_zheng_values(n_gradations: int) -> Tuple[float, ...]:
+    """Шкала Ма-Жена: n/(n+1-i) (РЗОД-2011-3.pdf)"""
+    i = np.arange(1, n_gradations + 1, dtype=np.float64)
+    values = n_gradations / (n_gradations + 1 - i)
+    np.minimum(values, 9.0, out=values)
+    return tuple(values.tolist())
+
+
+def _donegan_values(n_gradations: int) -> Tuple[float, ...]:
+    """Шкала Донегана-Додда-МакМастера (РЗОД-2011-3.pdf): логарифмічне розподілення"""
+    i = np.arange(n_gradations, dtype=np.float64)
+    return tuple((1.0 + 8.0 * (np.log1p(i) / math.log(n_gradations))).tolist())
+
+
+def _linear_values(n_gradations: int) -> Tuple[float, ...]:
+    """За замовчуванням лінійна шкала 1-9"""
+    return tuple((1.0 + np.arange(n_gradations) * (8.0 / (n_gradations - 1))).tolist())
+
+
+# Формула значень для кожного типу шкали
+_SCALE_FORMULAS: Dict[ScaleType, Callable[[int], Tuple[float, ...]]] = {
+    ScaleType.ORDINAL: _ordinal_values,
+    ScaleType.SAATY_5: _saaty_5_values,
+    ScaleType.SAATY_9: _saaty_9_values,
+    ScaleType.BALANCED: _balanced_values,
+    ScaleType.POWER: _power_values,
+    ScaleType.MA_ZHENG: _ma_zheng_values,
+    ScaleType.DONEGAN: _donegan_values,
+}
+
+
+def _compute_scale_values(scale_type: ScaleType, n_gradations: int) -> Tuple[float, ...]:
+    """
+    Обчислює значення шкали за її формулою (РЗОД-2011-3.pdf).
+    Кількість градацій має бути вже перевірена; викликається лише
+    під час побудови _SCALE_TABLES.
+    """
+    return _SCALE_FORMULAS.get(scale_type, _linear_values)(n_gradations)
+
+
+# Значення всіх шкал для всіх допустимих кількостей градацій, обчислені
+# один раз під час імпорту: get_scale_values зводиться до пошуку у словнику
+_SCALE_TABLES: Dict[Tuple[ScaleType, int], Tuple[float, ...]] = {
+    (scale_type, n_gradations): _compute_scale_values(scale_type, n_gradations)
+    for scale_type, (min_grad, max_grad) in SCALE_GRADATIONS_RANGE.items()
+    for n_gradations in range(min_grad, max_grad + 1)
+}
+
+# Шкали, що підтримують кожну кількість градацій (у порядку ScaleType)
+_SCALES_BY_GRADATIONS: Dict[int, Tuple[ScaleType, ...]] = {
+    n_gradations: tuple(
+        scale_type for scale_type, (min_grad, max_grad) in SCALE_GRADATIONS_RANGE.items()
+        if min_grad <= n_gradations <= max_grad
+    )
+    for n_gradations in range(2, 10)
+}
+
+
+def _readonly_array(values: Tuple[float, ...]) -> np.ndarray:
+    """Незмінний суцільний масив float64 зі значень шкали"""
+    array = np.ascontiguousarray(values, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+# Ті самі таблиці як масиви float64 для векторизованих обчислень
+_SCALE_ARRAYS: Dict[Tuple[ScaleType, int], np.ndarray] = {
+    key: _readonly_array(values) for key, values in _SCALE_TABLES.items()
+}
+
+
+def get_scale_values(scale_type: ScaleType, n_gradations: int) -> Tuple[float, ...]:
     """
     Повертає числові значення для заданої шкали та кількості градацій.
     Базується на РЗОД-2011-3.pdf (таблиці відповідників шкал)
 
+    Значення беруться з таблиці _SCALE_TABLES, побудованої під час імпорту;
+    повертається спільний незмінний кортеж.
+
     Args:
         scale_type: Тип шкали
         n_gradations: Кількість градацій (3-9)
 
     Returns:
-        Список числових значень шкали
+        Кортеж числових значень шкали
 
     Examples:
         >>> get_scale_values(ScaleType.SAATY_9, 9)
-        [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+        (1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0)
         >>> get_scale_values(ScaleType.ORDINAL, 2)
-        [1.0, 9.0]
+        (1.0, 9.0)
     """
-    min_grad, max_grad = SCALE_GRADATIONS_RANGE.get(scale_type, (3, 9))
-    if not (min_grad <= n_gradations <= max_grad):
+    values = _SCALE_TABLES.get((scale_type, n_gradations))
+    if values is None:
+        min_grad, max_grad = SCALE_GRADATIONS_RANGE.get(scale_type, (3, 9))
         raise ValueError(
             f"Шкала {scale_type.value} підтримує {min_grad}-{max_grad} градацій, отримано {n_gradations}"
         )
+    return values
 
-    if scale_type == ScaleType.ORDINAL:
-        # Порядкова: екстремальні значення 1 та 9
-        return [1.0, 9.0]
-
-    elif scale_type == ScaleType.SAATY_9:
-        # Фундаментальна шкала Сааті (РЗОД-2011-3.pdf)
-        # 1, 2, 3, 4, 5, 6, 7, 8, 9 для n=9
-        # Для менших n беремо перші n значень
-        return list(range(1, n_gradations + 1))
-
-    elif scale_type == ScaleType.SAATY_5:
-        # Сааті з 5 градаціями: 1, 3, 5, 7, 9 (РЗОД-2011-3.pdf)
-        if n_gradations == 5:
-            return [1.0, 3.0, 5.0, 7.0, 9.0]
-        elif n_gradations == 3:
-            return [1.0, 5.0, 9.0]
-        elif n_gradations == 4:
-            return [1.0, 3.0, 5.0, 9.0]
-        else:
-            # Для інших n інтерполюємо
-            return [1.0 + (i * 8.0 / (n_gradations - 1)) for i in range(n_gradations)]
-
-    elif scale_type == ScaleType.BALANCED:
-        # Збалансована шкала: w/(1-w), де w рівномірно розподілено (РЗОД-2011-3.pdf)
-        # Формула: для градації i від 1 до n, w_i = i/n, значення = w/(1-w)
-        values = []
-        for i in range(1, n_gradations + 1):
-            w = i / (n_gradations + 1)
-            if w >= 1.0:
-                w = 0.99  # Уникнення ділення на нуль
-            value = w / (1 - w)
-            # Обмежуємо діапазон 1-9
-            value = max(1.0, min(9.0, value))
-            values.append(value)
-        return values
-
-    elif scale_type == ScaleType.POWER:
-        # Степенева шкала: 9^((x-1)/(n-1)) (РЗОД-2011-3.pdf)
-        values = []
-        for i in range(n_gradations):
-            value = 9.0 ** (i / (n_gradations - 1)) if n_gradations > 1 else 1.0
-            values.append(value)
-        return values
-
-    elif scale_type == ScaleType.MA_ZHENG:
-        # Шкала Ма-Жена: n/(n+1-i) (РЗОД-2011-3.pdf)
-        values = []
-        for i in range(1, n_gradations + 1):
-            value = n_gradations / (n_gradations + 1 - i)
-            values.append(min(9.0, value))
-        return values
-
-    elif scale_type == ScaleType.DONEGAN:
-        # Шкала Донегана-Додда-МакМастера (РЗОД-2011-3.pdf)
-        # Логарифмічне розподілення
-        values = []
-        for i in range(n_gradations):
-            if n_gradations > 1:
-                value = 1.0 + 8.0 * (math.log(1 + i) / math.log(n_gradations))
-            else:
-                value = 1.0
-            values.append(value)
-        return values
 
-    else:
-        # За замовчуванням лінійна шкала 1-9
-        return [1.0 + (i * 8.0 / (n_gradations - 1)) for i in range(n_gradations)]
+def get_scale_values_array(scale_type: ScaleType, n_gradations: int) -> np.ndarray:
+    """
+    Значення шкали як масив float64 (див. get_scale_values) для
+    векторизованих обчислень. Повертається спільний масив лише для читання,
+    без копіювання.
+
+    Examples:
+        >>> get_scale_values_array(ScaleType.SAATY_5, 3)
+        array([1., 5., 9.])
+    """
+    values = _SCALE_ARRAYS.get((scale_type, n_gradations))
+    if values is None:
+        get_scale_values(scale_type, n_gradations)  # ValueError з допустимим діапазоном
+    return values
+
+
+def _closest_grade(scale_values: Tuple[float, ...], value: float) -> int:
+    """
+    Індекс (0-based) найближчої до value градації шкали бінарним пошуком.
+
+    Значення всіх шкал неспадні, тож найближчою є одна з двох сусідніх
+    градацій. Як і лінійний пошук min, з рівновіддалених обирається перша.
+    """
+    pos = bisect_left(scale_values, value)
+    if pos == len(scale_values) or (
+            pos > 0 and abs(scale_values[pos - 1] - value) <= abs(scale_values[pos] - value)):
+        # Ліва сусідка; на початку шкали значення можуть повторюватися
+        return bisect_left(scale_values, scale_values[pos - 1])
+    return pos
 
 
 def unify_to_cardinal(scale_type: ScaleType, n_gradations: int, grade_index: int) -> float:
@@ -168,11 +279,19 @@ def unify_to_cardinal(scale_type: ScaleType, n_gradations: int, grade_index: int
     return round(max(1.0, min(9.0, unified_value)))
 
 
+# Інформативність I = log₂ N для N = 0..9 (допустимі кількості градацій шкал);
+# None для N < 2, де вона не визначена
+_HARTLEY: Tuple[Optional[float], ...] = tuple(math.log2(n) if n >= 2 else None for n in range(10))
+
+
 def calculate_informativeness(n_gradations: int) -> float:
     """
     Розрахунок інформативності шкали за формулою Хартлі: I = log₂ N
     Базується на РЗОД-2011-2.pdf, РЗОД-2011-4.pdf
 
+    Для кількостей градацій шкал (до 9) значення береться з таблиці
+    _HARTLEY: функція викликається для кожної оцінки кожного експерта.
+
     Args:
         n_gradations: Кількість градацій шкали
 
@@ -188,43 +307,45 @@ def calculate_informativeness(n_gradations: int) -> float:
     if n_gradations < 2:
         raise ValueError("Кількість градацій має бути >= 2")
 
+    if n_gradations < len(_HARTLEY):
+        return _HARTLEY[n_gradations]
     return math.log2(n_gradations)
 
 
-def get_correspondence_table(n_gradations: int) -> Dict[ScaleType, List[float]]:
+def get_correspondence_table(n_gradations: int) -> Dict[ScaleType, Tuple[float, ...]]:
     """
     Генерує таблицю відповідників для всіх типів шкал з заданою кількістю градацій.
     Базується на РЗОД-2011-3.pdf (таблиці відповідників між шкалами)
 
+    Кожен виклик повертає новий словник зі спільних незмінних кортежів
+    _SCALE_TABLES, тож зміна результату не впливає на інші виклики.
+
     Args:
         n_gradations: Кількість градацій
 
     Returns:
-        Словник {тип_шкали: [значення]}
+        Словник {тип_шкали: (значення)}
 
     Examples:
         >>> table = get_correspondence_table(5)
         >>> len(table[ScaleType.SAATY_5])
         5
     """
-    correspondence = {}
-
-    for scale_type in ScaleType:
-        min_grad, max_grad = SCALE_GRADATIONS_RANGE.get(scale_type, (3, 9))
-        if min_grad <= n_gradations <= max_grad:
-            try:
-                correspondence[scale_type] = get_scale_values(scale_type, n_gradations)
-            except ValueError:
-                pass  # Пропускаємо шкали, які не підтримують дану кількість градацій
-
-    return correspondence
+    return {
+        scale_type: _SCALE_TABLES[(scale_type, n_gradations)]
+        for scale_type in _SCALES_BY_GRADATIONS.get(n_gradations, ())
+    }
 
 
+@lru_cache(maxsize=2048)
 def unify_judgment(scale_type: ScaleType, n_gradations: int,
                    original_value: float, is_reciprocal: bool = False) -> float:
     """
     Уніфікує одну експертну оцінку до єдиної кардинальної шкали.
 
+    Результат кешується: оцінки експертів беруться з дискретних шкал, тож
+    однакові (шкала, градації, значення) повторюються між експертами та парами.
+
     Args:
         scale_type: Тип шкали оцінки
         n_gradations: Кількість градацій шкали
@@ -244,22 +365,85 @@ def unify_judgment(scale_type: ScaleType, n_gradations: int,
     if is_reciprocal and original_value != 0:
         original_value = 1.0 / original_value
 
-    # Отримуємо значення шкали
-    scale_values = get_scale_values(scale_type, n_gradations)
+    # Знаходимо найближчу градацію. Для Сааті-9 (значення 1..9) та порядкової
+    # шкали (1, 9) вона визначається напряму, без пошуку; з рівновіддалених
+    # обирається менша, як і в _closest_grade
+    if scale_type is ScaleType.SAATY_9 and n_gradations == 9:
+        if original_value >= 9.0:
+            closest_index = 8
+        elif original_value > 1.5:
+            closest_index = math.ceil(original_value - 0.5) - 1
+        else:
+            closest_index = 0
+    elif scale_type is ScaleType.ORDINAL and n_gradations == 2:
+        closest_index = 1 if original_value > 5.0 else 0
+    else:
+        closest_index = _closest_grade(get_scale_values(scale_type, n_gradations),
+                                       original_value)
+
+    # Уніфікація через центри інтервалів (unify_to_cardinal для 1-based індексу
+    # closest_index + 1); індекс завжди в межах шкали, тож перевірка не потрібна
+    return round(max(1.0, min(9.0, 1.5 + (closest_index + 0.5) * 8.0 / n_gradations)))
 
-    # Знаходимо найближчу градацію
-    closest_index = min(range(len(scale_values)),
-                       key=lambda i: abs(scale_values[i] - original_value))
 
-    # Конвертуємо в уніфіковану шкалу (1-based індекс)
-    grade_index = closest_index + 1
+def unify_judgment_batch(scale_type: ScaleType, n_gradations: int,
+                         original_values: np.ndarray,
+                         is_reciprocal: Union[bool, np.ndarray] = False) -> np.ndarray:
+    """
+    Векторизована версія unify_judgment для масиву оцінок однієї шкали.
+    Результат поелементно збігається з unify_judgment.
 
-    return unify_to_cardinal(scale_type, n_gradations, grade_index)
+    Args:
+        scale_type: Тип шкали оцінок
+        n_gradations: Кількість градацій шкали
+        original_values: Масив вихідних значень оцінок
+        is_reciprocal: Чи є оцінки оберненими (a_ji = 1/a_ij): одне значення
+            для всіх оцінок або булевий масив тієї ж довжини
+
+    Returns:
+        Масив уніфікованих значень на шкалі [1, 9]
+
+    Examples:
+        >>> unify_judgment_batch(ScaleType.SAATY_9, 9, np.array([3.0, 7.4]))
+        array([4., 7.])
+        >>> unify_judgment_batch(ScaleType.SAATY_9, 9, np.array([0.25, 0.25]),
+        ...                      np.array([True, False]))
+        array([5., 2.])
+    """
+    values = np.asarray(original_values, dtype=float)
+
+    # Обробка обернених оцінок (поелементно, якщо передано масив)
+    if np.any(is_reciprocal):
+        values = np.divide(1.0, values, out=values.copy(),
+                           where=np.logical_and(is_reciprocal, values != 0))
+
+    scale_values = get_scale_values_array(scale_type, n_gradations)
+    if NUMBA_AVAILABLE:
+        closest_index = np.empty(values.shape[0], dtype=np.intp)
+        _closest_grades_kernel(values, scale_values, closest_index)
+    else:
+        # Найближча градація: бінарний пошук серед неспадних значень шкали і вибір
+        # ближчої з двох сусідок; з рівновіддалених, як і в unify_judgment, перша
+        pos = np.searchsorted(scale_values, values)
+        left = np.maximum(pos - 1, 0)
+        right = np.minimum(pos, n_gradations - 1)
+        take_left = np.abs(scale_values[left] - values) <= np.abs(scale_values[right] - values)
+        closest_index = np.where(take_left, np.searchsorted(scale_values, scale_values[left]), right)
+
+    # Уніфікація через центри інтервалів (див. unify_to_cardinal, РЗОД-2011-4.pdf)
+    l, p = 1.5, 9.5
+    unified_values = l + (closest_index + 0.5) * (p - l) / n_gradations
+    return np.rint(np.clip(unified_values, 1.0, 9.0))
 
 
 if __name__ == "__main__":
-    import doctest
-    doctest.testmod()
+    import os
+
+    # Doctest запускається через `python -m doctest scales.py`; у демонстрації
+    # лише за змінною середовища SCALES_RUN_DOCTESTS
+    if os.environ.get("SCALES_RUN_DOCTESTS"):
+        import doctest
+        doctest.testmod()
 
     # Демонстрація роботи модуля
     print("=== Демонстрація модуля scales.py ===\n")
@@ -5,10 +5,17 @@
 
 import sys
 import os
+import codecs
+import json
+import tempfile
+from dataclasses import replace
+
+import numpy as np
 
 # Додаємо поточну директорію до шляху
 sys.path.insert(0, os.path.dirname(__file__))
 
+from gui import models
 from gui.models import SessionModel, Judgment, Expert, ScaleType, ScaleManager
 
 
@@ -152,6 +159,373 @@ def test_demo_session():
         return False
 
 
+def _check_columns(expert):
+    """Стовпчики оцінок та індекс пар експерта відповідають списку judgments"""
+    # Стовпчики мають бути узгоджені без перебудови в judgment_columns
+    assert expert._synced == expert.judgments
+    alt_i, alt_j, values, scale_types, n_gradations = expert.judgment_columns()
+    assert len(values) == len(expert.judgments)
+    assert len(expert._judgment_index) == len(expert.judgments)
+    for idx, judgment in enumerate(expert.judgments):
+        assert expert._judgment_index[(judgment.alt_i, judgment.alt_j)] == idx
+        assert alt_i[idx] == expert.alt_index[judgment.alt_i]
+        assert alt_j[idx] == expert.alt_index[judgment.alt_j]
+        assert values[idx] == judgment.value
+        assert scale_types[idx] is judgment.scale_type
+        assert n_gradations[idx] == judgment.n_gradations
+
+
+def _filled_session(values_by_expert, competence=None):
+    """Сесія з альтернативами A, B, C, в якій кожен експерт оцінив усі пари"""
+    session = SessionModel()
+    expert_ids = [f"Експерт_{k + 1}" for k in range(len(values_by_expert))]
+    session.initialize_session(["A", "B", "C"], expert_ids, competence)
+    for expert, values in zip(session.experts, values_by_expert):
+        for (alt_i, alt_j), value in zip(session.all_pairs, values):
+            expert.add_judgment(Judgment(alt_i, alt_j, value, ScaleType.SAATY_9, 9))
+    return session
+
+
+def test_back_over_skipped_pair():
+    """Повернення через пропущену пару не видаляє оцінок інших пар"""
+    print("\n" + "=" * 60)
+    print("Тестування повернення через пропущену пару")
+    print("=" * 60)
+
+    from gui.controllers import MainController
+
+    class _Controller:
+        on_back = MainController.on_back
+
+        def __init__(self, session):
+            self.session = session
+
+        def _update_comparison_display(self):
+            pass
+
+    session = SessionModel()
+    session.initialize_session(["A", "B", "C"], ["Експерт_1"])
+    expert = session.get_current_expert()
+
+    # Пара A-B оцінена, пара A-C пропущена, поточна - B-C
+    session.add_judgment(Judgment("A", "B", 3.0, ScaleType.SAATY_9, 9))
+    session.next_pair()
+    session.next_pair()
+    assert session.get_current_pair() == ("B", "C")
+
+    controller = _Controller(session)
+    controller.on_back()
+    assert session.get_current_pair() == ("A", "C")
+    assert [(j.alt_i, j.alt_j) for j in expert.judgments] == [("A", "B")]
+
+    controller.on_back()
+    assert session.get_current_pair() == ("A", "B")
+    assert expert.judgments == []
+    _check_columns(expert)
+
+    print("\n✓ Тест повернення пройдено успішно!")
+    return True
+
+
+def test_replace_and_remove_judgment():
+    """Повторна оцінка пари замінює попередню; видалення зберігає індекс пар узгодженим"""
+    print("\n" + "=" * 60)
+    print("Тестування заміни та видалення оцінок")
+    print("=" * 60)
+
+    session = SessionModel()
+    session.initialize_session(["A", "B", "C"], ["Експерт_1"])
+    expert = session.get_current_expert()
+    expert.add_judgment(Judgment("A", "B", 3.0, ScaleType.SAATY_9, 9))
+    expert.add_judgment(Judgment("A", "C", 5.0, ScaleType.SAATY_9, 9))
+    expert.add_judgment(Judgment("B", "C", 7.0, ScaleType.SAATY_9, 9))
+
+    # Заміна: кількість оцінок не змінюється, позиція пари зберігається
+    expert.add_judgment(Judgment("A", "B", 3.0, ScaleType.SAATY_5, 5))
+    assert len(expert.judgments) == 3
+    assert expert.judgments[0].scale_type is ScaleType.SAATY_5
+    _check_columns(expert)
+
+    # Видалення не останньої оцінки: на її місце переходить остання (swap-pop)
+    removed = expert.remove_judgment("A", "B")
+    assert removed.scale_type is ScaleType.SAATY_5
+    assert [(j.alt_i, j.alt_j) for j in expert.judgments] == [("B", "C"), ("A", "C")]
+    _check_columns(expert)
+
+    # Видалення останньої оцінки списку
+    assert expert.remove_judgment("A", "C").value == 5.0
+    assert [(j.alt_i, j.alt_j) for j in expert.judgments] == [("B", "C")]
+    _check_columns(expert)
+
+    assert expert.remove_judgment("A", "C") is None
+
+    print("\n✓ Тест заміни та видалення пройдено успішно!")
+    return True
+
+
+def test_direct_judgments_mutation():
+    """Зміна списку judgments в обхід add_judgment не псує стовпчики оцінок"""
+    print("\n" + "=" * 60)
+    print("Тестування прямої зміни списку оцінок")
+    print("=" * 60)
+
+    session = SessionModel()
+    session.initialize_session(["A", "B", "C", "D"], ["Експерт_1"])
+    expert = session.get_current_expert()
+    expert.add_judgment(Judgment("A", "B", 3.0, ScaleType.SAATY_9, 9))
+    expert.judgments.append(Judgment("B", "C", 5.0, ScaleType.SAATY_9, 9))
+    expert.add_judgment(Judgment("C", "D", 7.0, ScaleType.SAATY_9, 9))
+    _check_columns(expert)
+
+    # МПП збігається з побудованою з тих самих оцінок через add_judgment
+    reference = SessionModel()
+    reference.initialize_session(["A", "B", "C", "D"], ["Експерт_1"])
+    for judgment in expert.judgments:
+        reference.experts[0].add_judgment(judgment)
+    pcm = session.build_pcm_list()[0]
+    assert np.array_equal(pcm.unified_matrix, reference.build_pcm_list()[0].unified_matrix)
+
+    # Видалення з кінця списку та заміна всього списку
+    expert.judgments.pop()
+    expert.judgment_columns()
+    _check_columns(expert)
+    expert.judgments = [Judgment("A", "D", 2.0, ScaleType.SAATY_9, 9)]
+    expert.judgment_columns()
+    _check_columns(expert)
+
+    print("\n✓ Тест прямої зміни оцінок пройдено успішно!")
+    return True
+
+
+def test_progress_navigation():
+    """Лічильник прогресу при переходах між експертами та після завантаження"""
+    print("\n" + "=" * 60)
+    print("Тестування прогресу навігації")
+    print("=" * 60)
+
+    session = SessionModel()
+    session.initialize_session(["A", "B", "C"], ["Експерт_1", "Експерт_2"])
+    assert session.get_progress() == (0, 6)
+
+    for _ in range(3):
+        session.next_pair()
+    assert (session.current_expert_idx, session.current_pair_idx) == (1, 0)
+    assert session.get_progress() == (3, 6)
+
+    assert session.prev_pair()
+    assert (session.current_expert_idx, session.current_pair_idx) == (0, 2)
+    assert session.get_progress() == (2, 6)
+
+    session.next_pair()
+    session.next_pair()
+    assert (session.current_expert_idx, session.current_pair_idx) == (1, 1)
+    assert session.get_progress() == (4, 6)
+
+    with tempfile.TemporaryDirectory() as directory:
+        session_file = os.path.join(directory, "session.json")
+        session.save_session(session_file)
+        loaded = SessionModel.load_session(session_file)
+    assert loaded.get_progress() == (4, 6)
+    assert loaded.get_current_pair() == session.get_current_pair()
+
+    print("\n✓ Тест прогресу пройдено успішно!")
+    return True
+
+
+def test_pair_at_matches_triu_indices():
+    """Пара за номером збігається з порядком np.triu_indices"""
+    print("\n" + "=" * 60)
+    print("Тестування обчислення пари за номером")
+    print("=" * 60)
+
+    for n in range(2, 10):
+        session = SessionModel()
+        session.initialize_session([f"A{k}" for k in range(n)], ["Експерт_1"])
+        pair_i, pair_j = np.triu_indices(n, k=1)
+        assert [session._pair_at(k) for k in range(len(pair_i))] == list(
+            zip(pair_i.tolist(), pair_j.tolist())
+        )
+
+    print("\n✓ Тест пар пройдено успішно!")
+    return True
+
+
+def test_results_cache_invalidation():
+    """Збережені результати оновлюються після зміни оцінок або компетентності"""
+    print("\n" + "=" * 60)
+    print("Тестування оновлення результатів")
+    print("=" * 60)
+
+    def weights(session):
+        return session.calculate_results()['weights']
+
+    session = _filled_session([[3.0, 5.0, 2.0], [0.5, 7.0, 4.0]])
+    first = session.calculate_results()
+    assert session.calculate_results() is first
+
+    # add_judgment: заміна оцінки пари
+    session.experts[1].add_judgment(Judgment("A", "B", 9.0, ScaleType.SAATY_9, 9))
+    expected = weights(_filled_session([[3.0, 5.0, 2.0], [9.0, 7.0, 4.0]]))
+    assert np.allclose(weights(session), expected)
+
+    # remove_judgment: МПП експерта стає неповною
+    session.experts[1].remove_judgment("B", "C")
+    fresh = _filled_session([[3.0, 5.0, 2.0], [9.0, 7.0, 4.0]])
+    fresh.experts[1].remove_judgment("B", "C")
+    assert np.allclose(weights(session), weights(fresh))
+
+    # set_competence та пряма зміна поля competence
+    session.set_competence("Експерт_1", 0.3)
+    fresh.experts[0].competence = 0.3
+    assert np.allclose(weights(session), weights(fresh))
+    session.experts[1].competence = 0.5
+    fresh.set_competence("Експерт_2", 0.5)
+    assert np.allclose(weights(session), weights(fresh))
+
+    print("\n✓ Тест оновлення результатів пройдено успішно!")
+    return True
+
+
+def test_pcm_cache_invalidation():
+    """build_pcm_list повторно використовує МПП і перебудовує їх після змін оцінок"""
+    print("\n" + "=" * 60)
+    print("Тестування кешу МПП")
+    print("=" * 60)
+
+    def matrices_match(session):
+        # МПП з кешу збігаються з МПП нової сесії з тими самими оцінками
+        fresh = SessionModel()
+        fresh.initialize_session(session.alternatives, [e.expert_id for e in session.experts])
+        for source, target in zip(session.experts, fresh.experts):
+            for judgment in source.judgments:
+                target.add_judgment(judgment)
+        return all(
+            np.array_equal(a.unified_matrix, b.unified_matrix)
+            for a, b in zip(session.build_pcm_list(), fresh.build_pcm_list())
+        )
+
+    session = _filled_session([[3.0, 5.0, 2.0], [2.0, 4.0, 3.0]])
+    first = session.build_pcm_list()
+    second = session.build_pcm_list()
+    assert all(a is b for a, b in zip(first, second))
+
+    # add_judgment перебудовує лише МПП зміненого експерта
+    session.experts[1].add_judgment(Judgment("A", "B", 9.0, ScaleType.SAATY_9, 9))
+    third = session.build_pcm_list()
+    assert third[0] is first[0] and third[1] is not first[1]
+    assert matrices_match(session)
+
+    session.experts[0].remove_judgment("B", "C")
+    fourth = session.build_pcm_list()
+    assert fourth[0] is not third[0] and fourth[1] is third[1]
+    assert matrices_match(session)
+
+    # Пряма зміна списку оцінок також інвалідовує кеш
+    session.experts[0].judgments.append(Judgment("B", "C", 7.0, ScaleType.SAATY_9, 9))
+    assert session.build_pcm_list()[0] is not fourth[0]
+    assert matrices_match(session)
+    session.experts[1].judgments[0] = Judgment("A", "B", 1 / 3, ScaleType.SAATY_9, 9)
+    assert session.build_pcm_list()[1] is not fourth[1]
+    assert matrices_match(session)
+
+    # Оцінки незмінні: змінити значення на місці неможливо
+    try:
+        session.experts[0].judgments[0].value = 1.0
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Judgment має бути незмінним")
+
+    print("\n✓ Тест кешу МПП пройдено успішно!")
+    return True
+
+
+def test_checkpoint_roundtrip():
+    """Контрольна точка відновлюється load_session без втрат"""
+    print("\n" + "=" * 60)
+    print("Тестування контрольної точки")
+    print("=" * 60)
+
+    session = _filled_session([[3.0, 5.0, 2.0], [0.5, 7.0, 4.0]],
+                              {"Експерт_1": 0.85, "Експерт_2": 0.6})
+    expert = session.experts[0]
+    expert.add_judgment(replace(
+        expert.judgments[0], scale_history=((ScaleType.SAATY_5, 5), (ScaleType.SAATY_9, 9))
+    ))
+    session.current_expert_idx = 1
+    session.current_pair_idx = 2
+
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint_file = os.path.join(directory, "checkpoint.bin")
+        session.save_checkpoint(checkpoint_file)
+        with open(checkpoint_file, 'rb') as f:
+            is_json = f.read(1) == b'{'
+        loaded = SessionModel.load_session(checkpoint_file)
+
+    # Без msgpack контрольна точка - компактний JSON
+    assert is_json == (models.msgpack is None)
+    assert loaded.alternatives == session.alternatives
+    assert [e.to_dict() for e in loaded.experts] == [e.to_dict() for e in session.experts]
+    assert (loaded.current_expert_idx, loaded.current_pair_idx) == (1, 2)
+    assert loaded.get_progress() == (5, 6)
+    for expert in loaded.experts:
+        _check_columns(expert)
+
+    print("\n✓ Тест контрольної точки пройдено успішно!")
+    return True
+
+
+def test_load_session_with_bom():
+    """Файл сесії з UTF-8 BOM завантажується як JSON (а не як контрольна точка msgpack)"""
+    print("\n" + "=" * 60)
+    print("Тестування завантаження JSON з BOM")
+    print("=" * 60)
+
+    session = _filled_session([[3.0, 5.0, 2.0]])
+    with tempfile.TemporaryDirectory() as directory:
+        session_file = os.path.join(directory, "session.json")
+        session.save_session(session_file)
+        with open(session_file, 'rb') as f:
+            raw = f.read()
+        with open(session_file, 'wb') as f:
+            f.write(codecs.BOM_UTF8 + raw)
+        loaded = SessionModel.load_session(session_file)
+
+    assert [e.to_dict() for e in loaded.experts] == [e.to_dict() for e in session.experts]
+
+    print("\n✓ Тест JSON з BOM пройдено успішно!")
+    return True
+
+
+def test_msgpack_checkpoint():
+    """Контрольна точка msgpack та JSON з BOM розрізняються при завантаженні"""
+    print("\n" + "=" * 60)
+    print("Тестування контрольної точки msgpack")
+    print("=" * 60)
+
+    if models.msgpack is None:
+        print("  msgpack не встановлено - тест пропущено")
+        return True
+
+    session = _filled_session([[3.0, 5.0, 2.0], [0.5, 7.0, 4.0]])
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint_file = os.path.join(directory, "checkpoint.bin")
+        session.save_checkpoint(checkpoint_file)
+        from_checkpoint = SessionModel.load_session(checkpoint_file)
+
+        bom_file = os.path.join(directory, "session.json")
+        with open(bom_file, 'wb') as f:
+            f.write(codecs.BOM_UTF8 + json.dumps(session._session_data(), default=models.json_default).encode('utf-8'))
+        from_bom = SessionModel.load_session(bom_file)
+
+    expected = [e.to_dict() for e in session.experts]
+    assert [e.to_dict() for e in from_checkpoint.experts] == expected
+    assert [e.to_dict() for e in from_bom.experts] == expected
+
+    print("\n✓ Тест контрольної точки msgpack пройдено успішно!")
+    return True
+
+
 def main():
     """Головна функція тестування"""
     print("\n" + "=" * 60)
@@ -162,6 +536,16 @@ def main():
         ("SessionModel", test_session_model),
         ("ScaleManager", test_scale_manager),
         ("Demo Session", test_demo_session),
+        ("Back Over Skipped Pair", test_back_over_skipped_pair),
+        ("Replace And Remove Judgment", test_replace_and_remove_judgment),
+        ("Direct Judgments Mutation", test_direct_judgments_mutation),
+        ("Progress Navigation", test_progress_navigation),
+        ("Pair Index", test_pair_at_matches_triu_indices),
+        ("Results Cache", test_results_cache_invalidation),
+        ("PCM Cache", test_pcm_cache_invalidation),
+        ("Checkpoint", test_checkpoint_roundtrip),
+        ("Session With BOM", test_load_session_with_bom),
+        ("Msgpack Checkpoint", test_msgpack_checkpoint),
     ]
 
     passed = 0